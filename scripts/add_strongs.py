@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Add Strong's Concordance numbers to book JSON files from STEPBible data.
+
+Generalizes add_strongs_2chronicles.py to every book covered by the
+STEPBible TAHOT (Hebrew OT) and TAGNT (Greek NT) files. The TSV files are
+read once, in a single streaming pass: rows are grouped per book as they
+arrive, and as soon as a book's rows are complete it is handed to a worker
+process that tags the verses and rewrites public/data/<Book>.json while the
+main process keeps reading.
+
+Tagging follows the same rules as the 2 Chronicles script: function words are
+skipped and each remaining word takes the first Strong's number of the first
+unused gloss that matches it. Numbers are written as they appear in the
+source (e.g. [H0430G]); run normalize_strongs.py afterwards to
+normalize them.
+
+Usage:
+    python3 scripts/add_strongs.py <tsv_file> [<tsv_file> ...]
+    python3 scripts/add_strongs.py --books Genesis Exodus --jobs 4 "TAHOT Gen-Deu ....txt"
+    python3 scripts/add_strongs.py --benchmark "TAHOT Gen-Deu ....txt"
+"""
+
+import argparse
+import json
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from aggregate_and_verify import write_book_json
+
+# STEPBible book abbreviations -> book file names
+STEP_BOOKS = {
+    'Gen': 'Genesis', 'Exo': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers',
+    'Deu': 'Deuteronomy', 'Jos': 'Joshua', 'Jdg': 'Judges', 'Rut': 'Ruth',
+    '1Sa': '1Samuel', '2Sa': '2Samuel', '1Ki': '1Kings', '2Ki': '2Kings',
+    '1Ch': '1Chronicles', '2Ch': '2Chronicles', 'Ezr': 'Ezra', 'Neh': 'Nehemiah',
+    'Est': 'Esther', 'Job': 'Job', 'Psa': 'Psalms', 'Pro': 'Proverbs',
+    'Ecc': 'Ecclesiastes', 'Sng': 'SongofSolomon', 'Isa': 'Isaiah', 'Jer': 'Jeremiah',
+    'Lam': 'Lamentations', 'Ezk': 'Ezekiel', 'Dan': 'Daniel', 'Hos': 'Hosea',
+    'Jol': 'Joel', 'Amo': 'Amos', 'Oba': 'Obadiah', 'Jon': 'Jonah',
+    'Mic': 'Micah', 'Nam': 'Nahum', 'Hab': 'Habakkuk', 'Zep': 'Zephaniah',
+    'Hag': 'Haggai', 'Zec': 'Zechariah', 'Mal': 'Malachi',
+    'Mat': 'Matthew', 'Mrk': 'Mark', 'Luk': 'Luke', 'Jhn': 'John',
+    'Act': 'Acts', 'Rom': 'Romans', '1Co': '1Corinthians', '2Co': '2Corinthians',
+    'Gal': 'Galatians', 'Eph': 'Ephesians', 'Php': 'Philippians', 'Col': 'Colossians',
+    '1Th': '1Thessalonians', '2Th': '2Thessalonians', '1Ti': '1Timothy', '2Ti': '2Timothy',
+    'Tit': 'Titus', 'Phm': 'Philemon', 'Heb': 'Hebrews', 'Jas': 'James',
+    '1Pe': '1Peter', '2Pe': '2Peter', '1Jn': '1John', '2Jn': '2John',
+    '3Jn': '3John', 'Jud': 'Jude', 'Rev': 'Revelation',
+}
+
+# Words that typically don't get Strong's numbers (articles, prepositions, etc.)
+SKIP_WORDS = {
+    'a', 'an', 'and', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'had', 'has', 'have',
+    'he', 'her', 'him', 'his', 'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or', 'our',
+    'she', 'so', 'that', 'the', 'their', 'them', 'there', 'these', 'they', 'this', 'those',
+    'to', 'was', 'we', 'were', 'what', 'when', 'where', 'which', 'who', 'will', 'with',
+    'you', 'your', 'up', 'out', 'into', 'upon', 'unto', 'all', 'not', 'than', 'then',
+}
+
+# Reference like "2Ch.1.1#01=L"; rows whose Hebrew versification differs
+# carry it in parentheses, e.g. "Psa.51.1(51.3)#01=L"
+REF_PATTERN = re.compile(r'(\w{3})\.(\d+)\.(\d+)(\([\d.]+\))?#(\d+)')
+GLOSS_STRIP = re.compile(r'[\[\]/<>]')
+HEBREW_STRONGS = re.compile(r'H\d+[A-Z]?')
+GREEK_STRONGS = re.compile(r'G\d+[A-Z]?')
+WORD_PATTERN = re.compile(r"(\w+['’]?\w*|[^\w]+)")
+NON_WORD = re.compile(r'[^\w]')
+WORD_START = re.compile(r'\w')
+
+NT_START = list(STEP_BOOKS).index('Mat')
+GREEK_BOOKS = set(list(STEP_BOOKS)[NT_START:])
+
+VerseData = Dict[Tuple[int, int], List[Tuple[str, List[str]]]]
+
+
+def parse_step_line(line: str, alternate_refs=True) -> Tuple[str, int, int, int, str, List[str]]:
+    """
+    Parse a TAHOT or TAGNT word row.
+    Returns: (book_abbrev, chapter, verse, word_num, english_gloss, strongs_list),
+    or None for headers, comments and books that are not in STEP_BOOKS.
+    Rows with an alternate versification are read by their English reference,
+    or skipped when alternate_refs is False.
+    """
+    ref_match = REF_PATTERN.match(line)
+    if not ref_match or ref_match.group(1) not in STEP_BOOKS:
+        return None
+    if ref_match.group(4) and not alternate_refs:
+        return None
+
+    parts = line.split('\t')
+    if len(parts) < 5:
+        return None
+
+    abbrev = ref_match.group(1)
+    chapter, verse, word_num = map(int, ref_match.group(2, 3, 5))
+
+    if abbrev in GREEK_BOOKS:
+        # TAGNT: English translation in column 2, "G0976=N-NSF" in column 3
+        english_gloss = parts[2]
+        strongs_numbers = GREEK_STRONGS.findall(parts[3])
+    else:
+        # TAHOT: English translation in column 3, "H9003/{H7225G}" in column 4,
+        # where H9xxx are grammatical markers rather than words
+        english_gloss = parts[3]
+        strongs_numbers = [s for s in HEBREW_STRONGS.findall(parts[4]) if not s.startswith('H9')]
+
+    # Remove brackets and slashes for comparison
+    english_gloss = GLOSS_STRIP.sub('', english_gloss.strip()).lower()
+
+    return (abbrev, chapter, verse, word_num, english_gloss, strongs_numbers)
+
+
+def iter_step_books(tsv_files: List[str], alternate_refs=True) -> Iterator[Tuple[str, VerseData]]:
+    """
+    Stream the TSV files once, yielding (book_name, verse_data) as soon as
+    each book's rows are complete. verse_data maps (chapter, verse) to a list
+    of (english_gloss, strongs_list) tuples.
+    """
+    current = None
+    verse_data = {}
+    finished = set()
+
+    for tsv_file in tsv_files:
+        with open(tsv_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                parsed = parse_step_line(line, alternate_refs)
+                if not parsed:
+                    continue
+
+                abbrev, chapter, verse, _, english_gloss, strongs_numbers = parsed
+                if abbrev != current:
+                    if current is not None:
+                        finished.add(current)
+                        yield STEP_BOOKS[current], verse_data
+                    if abbrev in finished:
+                        raise ValueError(f"{tsv_file}: rows for {abbrev} are not contiguous")
+                    current = abbrev
+                    verse_data = {}
+
+                words = verse_data.setdefault((chapter, verse), [])
+                if strongs_numbers:
+                    words.append((english_gloss, strongs_numbers))
+
+    if current is not None:
+        yield STEP_BOOKS[current], verse_data
+
+
+def find_best_word_match(word: str, glosses: List[str], used_indices: Set[int]) -> int:
+    """
+    Find the best matching gloss for a given English word.
+    Returns the index of the best match, or -1 if no good match found.
+
+    This is the reference definition of a match; tagging uses GlossIndex,
+    which returns the same index without scanning every gloss.
+    """
+    word_clean = NON_WORD.sub('', word).lower()
+
+    for i, gloss in enumerate(glosses):
+        if i in used_indices:
+            continue
+
+        gloss_words = gloss.split()
+        for gw in gloss_words:
+            if word_clean == gw or word_clean.startswith(gw) or gw.startswith(word_clean):
+                if len(word_clean) > 2 and len(gw) > 2:  # Avoid very short matches
+                    return i
+
+    return -1
+
+
+class GlossScan:
+    """Reference matcher: scans every unused gloss with find_best_word_match"""
+
+    def __init__(self, glosses: List[str]):
+        self.glosses = glosses
+        self.used_indices = set()
+
+    def match(self, word: str) -> int:
+        return find_best_word_match(word, self.glosses, self.used_indices)
+
+    def use(self, index: int):
+        self.used_indices.add(index)
+
+
+class GlossIndex:
+    """
+    Per-verse gloss index giving the same answers as find_best_word_match.
+
+    A gloss word gw matches a cleaned word w when both are longer than two
+    letters and one is a prefix of the other, so they always share their
+    first three letters. Gloss words are bucketed by those three letters, in
+    gloss order, and a lookup only scans the word's own bucket. Entries of
+    used glosses are dropped from a bucket the next time it is scanned, so
+    each entry is removed at most once (O(1) amortized).
+    """
+
+    def __init__(self, glosses: List[str]):
+        self.used = bytearray(len(glosses))
+        self.buckets = {}  # first three letters -> [(gloss index, gloss word), ...]
+
+        for i, gloss in enumerate(glosses):
+            for gw in gloss.split():
+                if len(gw) > 2:
+                    bucket = self.buckets.get(gw[:3])
+                    if bucket is None:
+                        self.buckets[gw[:3]] = [(i, gw)]
+                    else:
+                        bucket.append((i, gw))
+
+    def match(self, word: str) -> int:
+        """Index of the first unused gloss matching word, or -1"""
+        word_clean = NON_WORD.sub('', word).lower()
+        if len(word_clean) <= 2:
+            return -1
+
+        bucket = self.buckets.get(word_clean[:3])
+        if not bucket:
+            return -1
+
+        used = self.used
+        stale = False
+        for i, gw in bucket:
+            if used[i]:
+                stale = True
+            elif word_clean.startswith(gw) or gw.startswith(word_clean):
+                break
+        else:
+            i = -1
+
+        if stale:
+            bucket[:] = [entry for entry in bucket if not used[entry[0]]]
+        return i
+
+    def use(self, index: int):
+        self.used[index] = 1
+
+
+def add_strongs_to_verse(verse_text: str, tahot_words: List[Tuple[str, List[str]]],
+                         matcher=GlossIndex) -> str:
+    """
+    Add Strong's numbers to a KJV verse text using TAHOT/TAGNT data.
+
+    Strategy:
+    - Skip common function words
+    - Match significant words with the source glosses
+    - Add first Strong's number when a good match is found
+    """
+    if not tahot_words:
+        return verse_text
+
+    # Split verse into words, preserving spaces and punctuation
+    tokens = WORD_PATTERN.findall(verse_text)
+
+    # The gloss lookup is built once per verse
+    glosses = matcher([g for g, _ in tahot_words])
+
+    # Build modified verse
+    result = []
+
+    for token in tokens:
+        # Whitespace, punctuation and function words are kept as is
+        if not WORD_START.match(token) or token.lower() in SKIP_WORDS:
+            result.append(token)
+            continue
+
+        match_idx = glosses.match(token)
+
+        if match_idx >= 0:
+            _, strongs = tahot_words[match_idx]
+            result.append(f"{token}[{strongs[0]}]")
+            glosses.use(match_idx)
+        else:
+            result.append(token)
+
+    return ''.join(result)
+
+
+def tag_book(book_file: Path, verse_data: VerseData, backup=True) -> Dict:
+    """Tag one book file in place; returns statistics and a few examples"""
+    stats = {"book": book_file.stem, "verses": 0, "verses_with_data": 0, "verses_modified": 0,
+             "examples": [], "written": False}
+
+    with open(book_file, 'r', encoding='utf-8') as f:
+        bible_data = json.load(f)
+
+    for chapter in bible_data['chapters']:
+        chapter_num = int(chapter['chapter'])
+
+        for verse in chapter['verses']:
+            stats["verses"] += 1
+            key = (chapter_num, int(verse['verse']))
+
+            if key in verse_data:
+                stats["verses_with_data"] += 1
+                original_text = verse['text']
+                modified_text = add_strongs_to_verse(original_text, verse_data[key])
+
+                if modified_text != original_text:
+                    verse['text'] = modified_text
+                    stats["verses_modified"] += 1
+                    if len(stats["examples"]) < 2:
+                        stats["examples"].append((f"{chapter_num}:{key[1]}", original_text, modified_text))
+
+    if stats["verses_modified"]:
+        if backup:
+            shutil.copy2(book_file, book_file.with_suffix('.json.bak'))
+        write_book_json(bible_data, book_file)
+        stats["written"] = True
+
+    return stats
+
+
+def _tag_book_task(args):
+    """Worker entry point for the process pool"""
+    book_file, verse_data, backup = args
+    if not book_file.exists():
+        return {"book": book_file.stem, "missing": True}
+    return tag_book(book_file, verse_data, backup)
+
+
+def tag_books(tsv_files: List[str], data_dir: Path, books: Set[str] = None,
+              jobs: int = None, backup=True, alternate_refs=True) -> List[Dict]:
+    """
+    Stream the TSV files and tag every book they cover (or only `books`).
+
+    Each book is submitted to the pool as soon as its last row has been read,
+    so tagging overlaps with parsing the rest of the files. See
+    parse_step_line for alternate_refs.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for book_name, verse_data in iter_step_books(tsv_files, alternate_refs):
+            if books and book_name not in books:
+                continue
+            task = (data_dir / f"{book_name}.json", verse_data, backup)
+            futures.append(executor.submit(_tag_book_task, task))
+        for future in futures:
+            results.append(future.result())
+    return results
+
+
+def benchmark_matchers(tsv_files: List[str], data_dir: Path, books: Set[str] = None) -> Dict:
+    """
+    Tag every verse covered by the TSV files with both GlossScan and
+    GlossIndex, without writing anything, and compare time and output.
+    """
+    verses = []
+    for book_name, verse_data in iter_step_books(tsv_files):
+        book_file = data_dir / f"{book_name}.json"
+        if books and book_name not in books or not book_file.exists():
+            continue
+        with open(book_file, 'r', encoding='utf-8') as f:
+            bible_data = json.load(f)
+        for chapter in bible_data['chapters']:
+            for verse in chapter['verses']:
+                words = verse_data.get((int(chapter['chapter']), int(verse['verse'])))
+                if words:
+                    verses.append((verse['text'], words))
+
+    results = {"verses": len(verses)}
+    outputs = {}
+    for name, matcher in (("scan", GlossScan), ("index", GlossIndex)):
+        start = time.perf_counter()
+        outputs[name] = [add_strongs_to_verse(text, words, matcher) for text, words in verses]
+        results[f"{name}_seconds"] = round(time.perf_counter() - start, 3)
+
+    results["identical"] = outputs["scan"] == outputs["index"]
+    results["speedup"] = round(results["scan_seconds"] / max(results["index_seconds"], 1e-9), 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add Strong's numbers to book files from STEPBible TAHOT/TAGNT data")
+    parser.add_argument("tsv_files", nargs="+", help="STEPBible TAHOT or TAGNT .txt files")
+    parser.add_argument("--data", default=str(Path(__file__).parent.parent / 'public' / 'data'),
+                        help="Directory containing book-level JSON files")
+    parser.add_argument("--books", nargs="+", help="Only tag these books (e.g. 2Chronicles)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-backup", action="store_true", help="Do not keep <Book>.json.bak copies")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare the indexed gloss matcher with the reference scan; writes nothing")
+
+    args = parser.parse_args()
+
+    for tsv_file in args.tsv_files:
+        if not Path(tsv_file).exists():
+            print(f"Error: STEPBible file not found: {tsv_file}")
+            sys.exit(1)
+
+    if args.benchmark:
+        try:
+            results = benchmark_matchers(args.tsv_files, Path(args.data), books=set(args.books or []))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Verses tagged: {results['verses']}")
+        print(f"  Reference scan: {results['scan_seconds']:.3f}s")
+        print(f"  Gloss index:    {results['index_seconds']:.3f}s ({results['speedup']}x)")
+        print(f"  Identical output: {'yes' if results['identical'] else 'NO'}")
+        sys.exit(0 if results["identical"] else 1)
+
+    print(f"Streaming {len(args.tsv_files)} STEPBible file(s)...")
+    try:
+        results = tag_books(args.tsv_files, Path(args.data), books=set(args.books or []),
+                            jobs=args.jobs, backup=not args.no_backup)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    totals = {"verses": 0, "verses_with_data": 0, "verses_modified": 0}
+    for stats in results:
+        if stats.get("missing"):
+            print(f"\n  {stats['book']}: book file not found, skipped")
+            continue
+        for key in totals:
+            totals[key] += stats[key]
+        print(f"\n  {stats['book']}: {stats['verses_modified']} of {stats['verses']} verses modified"
+              + ("" if stats["written"] else " (unchanged)"))
+        for reference, before, after in stats["examples"]:
+            print(f"    {reference}")
+            print(f"      Before: {before[:100]}...")
+            print(f"      After:  {after[:100]}...")
+
+    print(f"\nSummary:")
+    print(f"  Books processed: {len(results)}")
+    print(f"  Total verses: {totals['verses']}")
+    print(f"  Verses with source data: {totals['verses_with_data']}")
+    print(f"  Verses modified: {totals['verses_modified']}")
+    print(f"  Books written: {sum(1 for stats in results if stats.get('written'))}")
+    print("Done!")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,9 +19,18 @@ import sys
 import argparse
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
-from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple, Any
+from collections import Counter, defaultdict, deque
 import difflib
+import gzip
+import hashlib
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+import verse_rules
+from book_stream import BookStreamError, iter_book_events, iter_chapters
 
 # Standard KJV chapter counts for verification
 KJV_CHAPTER_COUNTS = {
@@ -41,13 +50,26 @@ KJV_CHAPTER_COUNTS = {
     "Jude": 1, "Revelation": 22
 }
 
+# Normalized verses at least this similar are "Minor text differences"
+SIMILARITY_THRESHOLD = 0.9
+
+# Per-chapter files of the web output profile go to <target>/chapters/<Book>/
+WEB_CHAPTER_DIR = "chapters"
+
 
 class BibleVerifier:
     """Handles Bible data verification and comparison"""
     
+    NORMALIZATION_VERSION = 1
+    
     def __init__(self, verbose=False):
         self.verbose = verbose
         self.issues = defaultdict(list)
+        # How often each comparison outcome and similarity tier was reached
+        self.counters = Counter()
+        # Compute the exact ratio for significant differences a bound ruled out;
+        # cleared while differences are only being counted, never reported
+        self.exact_similarity = True
         
     def log(self, message):
         """Print message if verbose mode is enabled"""
@@ -55,7 +77,12 @@ class BibleVerifier:
             print(message)
     
     def normalize_text(self, text: str) -> str:
-        """Normalize text for comparison by removing Strong's numbers and extra whitespace"""
+        """
+        Normalize text for comparison by removing Strong's numbers and extra whitespace.
+        
+        NORMALIZATION_VERSION must be bumped whenever this changes, so that
+        hash manifests of normalized text are rebuilt.
+        """
         # Remove Strong's numbers like [H430] or [G2316]
         text = re.sub(r'\[H\d+\]|\[G\d+\]', '', text)
         # Remove em tags
@@ -66,44 +93,11 @@ class BibleVerifier:
     
     def check_encoding(self, text: str) -> List[str]:
         """Check for encoding issues in text"""
-        issues = []
-        
-        # Check for common encoding problems
-        problematic_chars = ['�', '\ufffd']  # Replacement character
-        for char in problematic_chars:
-            if char in text:
-                issues.append(f"Encoding issue: replacement character '{char}' found")
-        
-        # Check for unexpected control characters
-        control_chars = [c for c in text if ord(c) < 32 and c not in '\n\r\t']
-        if control_chars:
-            issues.append(f"Control characters found: {[ord(c) for c in control_chars]}")
-        
-        # Check for valid UTF-8 encoding
-        try:
-            text.encode('utf-8')
-        except UnicodeEncodeError as e:
-            issues.append(f"UTF-8 encoding error: {e}")
-        
-        return issues
+        return verse_rules.check_encoding(text)
     
     def check_punctuation(self, text: str) -> List[str]:
         """Check for punctuation issues"""
-        issues = []
-        
-        # Check for double punctuation (but allow ... and !! and ?)
-        if re.search(r'\.{4,}|[?!,;:]{2,}', text):
-            issues.append("Unusual punctuation pattern")
-        
-        # Check for space before punctuation (common OCR error)
-        if re.search(r'\s+[.,;:]', text):
-            issues.append("Space before punctuation")
-        
-        # Check for missing space after sentence-ending punctuation
-        if re.search(r'[.?!][A-Z]', text):
-            issues.append("Missing space after sentence-ending punctuation")
-        
-        return issues
+        return verse_rules.check_punctuation(text)
     
     def compare_verses(self, verse1: Dict, verse2: Dict, book: str, chapter: str, verse: str) -> Dict:
         """Compare two verse objects and return differences"""
@@ -120,6 +114,7 @@ class BibleVerifier:
         
         # Exact comparison first
         if text1 == text2:
+            self.counters["identical"] += 1
             return result
         
         result["identical"] = False
@@ -129,56 +124,159 @@ class BibleVerifier:
         norm2 = self.normalize_text(text2)
         
         if norm1 == norm2:
+            self.counters["formatting_only"] += 1
             result["differences"].append("Only Strong's numbers or formatting differ")
         else:
-            # Calculate similarity
-            similarity = difflib.SequenceMatcher(None, norm1, norm2).ratio()
-            result["similarity"] = similarity
+            similarity, exact = self.similarity(norm1, norm2)
             
-            if similarity < 0.9:
-                result["differences"].append(f"Significant text difference (similarity: {similarity:.2%})")
+            if similarity < SIMILARITY_THRESHOLD:
+                if not exact and self.exact_similarity:
+                    # A bound settled the classification; report the real ratio
+                    self.counters["difflib_reported"] += 1
+                    similarity, exact = _exact_similarity(norm1, norm2), True
+                if exact:
+                    result["similarity"] = similarity
+                    result["differences"].append(f"Significant text difference (similarity: {similarity:.2%})")
+                else:
+                    result["differences"].append("Significant text difference")
                 result["text1"] = text1[:100] + "..." if len(text1) > 100 else text1
                 result["text2"] = text2[:100] + "..." if len(text2) > 100 else text2
             else:
+                result["similarity"] = similarity
                 result["differences"].append("Minor text differences")
         
         return result
+    
+    def similarity(self, norm1: str, norm2: str) -> Tuple[float, bool]:
+        """
+        Similarity of two normalized texts, computed in tiers.
+        
+        Returns (value, exact). Cheap upper bounds on SequenceMatcher.ratio()
+        are tried first: the length ratio, then the character-multiset
+        overlap. Only when both bounds reach SIMILARITY_THRESHOLD is the
+        quadratic exact ratio computed, so classification is unchanged.
+        The bounds only classify: compare_verses still reports the exact
+        ratio unless exact_similarity is cleared.
+        """
+        total = len(norm1) + len(norm2)
+        
+        bound = 2.0 * min(len(norm1), len(norm2)) / total
+        if bound < SIMILARITY_THRESHOLD:
+            self.counters["length_bound"] += 1
+            return bound, False
+        
+        matches = sum((Counter(norm1) & Counter(norm2)).values())
+        bound = 2.0 * matches / total
+        if bound < SIMILARITY_THRESHOLD:
+            self.counters["multiset_bound"] += 1
+            return bound, False
+        
+        self.counters["difflib"] += 1
+        return _exact_similarity(norm1, norm2), True
+
+
+@lru_cache(maxsize=4096)
+def _exact_similarity(norm1: str, norm2: str) -> float:
+    """difflib ratio, cached because duplicated verses repeat the same pairs"""
+    return difflib.SequenceMatcher(None, norm1, norm2).ratio()
 
 
 class BookAggregator:
     """Aggregates per-chapter files into book-level JSON"""
     
-    def __init__(self, source_dir: str, verbose=False):
+    def __init__(self, source_dir: str, verbose=False, read_threads=0):
         self.source_dir = Path(source_dir)
         self.verbose = verbose
+        self._file_index = None
+        self._chapter_numbers = {}
+        # Threads that read chapter files ahead of the chapter being consumed
+        self.read_threads = read_threads
+        self.executor = ThreadPoolExecutor(read_threads) if read_threads > 0 else None
         
     def log(self, message):
         """Print message if verbose mode is enabled"""
         if self.verbose:
             print(message)
     
+    def close(self):
+        """Stop the chapter reading threads, if any"""
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+    
+    def index_source(self) -> Dict[str, List[Path]]:
+        """
+        Classify every file in the source directory in a single scan.
+        
+        A top-level file is filed under each prefix that ends just before a
+        "_" or "-" (Genesis_1.json under "Genesis", Song-of-Songs_1.json under
+        "Song", "Song-of" and "Song-of-Songs"), and a subdirectory's .json
+        files under the directory name. Looking up a book name or its
+        lowercase form then matches what globbing for <book>_*.json,
+        <book>-*.json and <book>/*.json would. Chapter numbers are extracted
+        once here. The index is built on first use; call rescan() after the
+        source directory changes.
+        """
+        if self._file_index is not None:
+            return self._file_index
+        
+        index = defaultdict(list)
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    with os.scandir(entry.path) as chapter_entries:
+                        for chapter_entry in chapter_entries:
+                            if chapter_entry.name.endswith(".json"):
+                                index[name + "/"].append(Path(chapter_entry.path))
+                elif name.endswith(".json"):
+                    path = Path(entry.path)
+                    for position, char in enumerate(name[:-len(".json")]):
+                        if char in "_-":
+                            index[name[:position]].append(path)
+        
+        self._chapter_numbers = {
+            path: self.extract_chapter_number(path.name)
+            for paths in index.values() for path in paths
+        }
+        self._file_index = dict(index)
+        self.log(f"Indexed {len(self._chapter_numbers)} files in {self.source_dir}")
+        return self._file_index
+    
+    def rescan(self):
+        """Forget the source index so the next lookup scans the directory again"""
+        self._file_index = None
+        self._chapter_numbers = {}
+    
     def find_chapter_files(self, book_name: str) -> List[Path]:
         """Find all chapter files for a given book"""
-        # Look for patterns like: Genesis_1.json, Genesis_01.json, Genesis-1.json, etc.
-        patterns = [
-            f"{book_name}_*.json",
-            f"{book_name}-*.json",
-            f"{book_name}/*.json",
-            f"{book_name.lower()}_*.json",
-            f"{book_name.lower()}-*.json",
-            f"{book_name.lower()}/*.json"
-        ]
-        
-        chapter_files = []
-        for pattern in patterns:
-            chapter_files.extend(self.source_dir.glob(pattern))
-        
-        # Also check subdirectories
-        book_dir = self.source_dir / book_name
-        if book_dir.exists() and book_dir.is_dir():
-            chapter_files.extend(book_dir.glob("*.json"))
-        
-        return list(set(chapter_files))  # Remove duplicates
+        # Look for patterns like: Genesis_1.json, Genesis_01.json, Genesis-1.json,
+        # Genesis/1.json, and the same with the book name in lowercase
+        index = self.index_source()
+        chapter_files = set()
+        for name in {book_name, book_name.lower()}:
+            chapter_files.update(index.get(name, []))
+            chapter_files.update(index.get(name + "/", []))
+        
+        return sorted(chapter_files)
+    
+    def snapshot_book(self, book_name: str) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of each of a book's chapter files, for change detection"""
+        snapshot = {}
+        for chapter_file in self.find_chapter_files(book_name):
+            try:
+                stat = chapter_file.stat()
+            except OSError:
+                continue  # Removed since the directory was scanned
+            snapshot[str(chapter_file)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def chapter_number(self, chapter_file: Path) -> int:
+        """Chapter number of an indexed file, falling back to parsing its name"""
+        number = self._chapter_numbers.get(chapter_file)
+        if number is None:
+            number = self.extract_chapter_number(chapter_file.name)
+        return number
     
     def extract_chapter_number(self, filename: str) -> int:
         """Extract chapter number from filename"""
@@ -192,57 +290,92 @@ class BookAggregator:
             return int(match.group(1))
         return 0
     
-    def aggregate_book(self, book_name: str) -> Dict:
-        """Aggregate all chapters for a book into a single JSON structure"""
-        self.log(f"Aggregating {book_name}...")
+    def load_chapter(self, chapter_file: Path) -> Dict:
+        """Read one chapter file as {"chapter", "verses"}; None if it cannot be used"""
+        try:
+            with open(chapter_file, 'r', encoding='utf-8') as f:
+                chapter_data = json.load(f)
+        except json.JSONDecodeError as e:
+            self.log(f"  Error parsing {chapter_file.name}: {e}")
+            return None
+        except Exception as e:
+            self.log(f"  Error reading {chapter_file.name}: {e}")
+            return None
+        
+        # Handle different input formats
+        if isinstance(chapter_data, dict):
+            # If the file already has chapter structure
+            if "chapter" in chapter_data and "verses" in chapter_data:
+                return chapter_data
+            # If it's just a list of verses
+            elif "verses" in chapter_data:
+                return {
+                    "chapter": str(self.chapter_number(chapter_file)),
+                    "verses": chapter_data["verses"]
+                }
+        elif isinstance(chapter_data, list):
+            # If the file is just an array of verses
+            return {
+                "chapter": str(self.chapter_number(chapter_file)),
+                "verses": chapter_data
+            }
+        return None
+    
+    def iter_chapters(self, book_name: str) -> Iterator[Dict]:
+        """
+        Yield a book's chapters in chapter-file order.
         
+        With read_threads, files are read and parsed in a thread pool while
+        earlier chapters are being consumed, which overlaps I/O latency on
+        cold caches and network mounts. At most two reads per thread are in
+        flight, so memory stays bounded by the read-ahead window.
+        """
         chapter_files = self.find_chapter_files(book_name)
         if not chapter_files:
             self.log(f"  No chapter files found for {book_name}")
-            return None
+            return
         
         self.log(f"  Found {len(chapter_files)} chapter files")
         
         # Sort by chapter number
-        chapter_files.sort(key=lambda f: self.extract_chapter_number(f.name))
+        chapter_files.sort(key=self.chapter_number)
+        
+        executor = self.executor
+        if executor is None:
+            for chapter_file in chapter_files:
+                chapter = self.load_chapter(chapter_file)
+                if chapter is not None:
+                    yield chapter
+            return
+        
+        window = 2 * self.read_threads
+        pending = deque()
+        files = iter(chapter_files)
+        try:
+            for chapter_file in files:
+                pending.append(executor.submit(self.load_chapter, chapter_file))
+                if len(pending) >= window:
+                    break
+            while pending:
+                chapter = pending.popleft().result()
+                next_file = next(files, None)
+                if next_file is not None:
+                    pending.append(executor.submit(self.load_chapter, next_file))
+                if chapter is not None:
+                    yield chapter
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def aggregate_book(self, book_name: str) -> Dict:
+        """Aggregate all chapters for a book into a single JSON structure"""
+        self.log(f"Aggregating {book_name}...")
         
         book_data = {
             "book": book_name,
-            "chapters": []
+            "chapters": list(self.iter_chapters(book_name))
         }
         
-        for chapter_file in chapter_files:
-            try:
-                with open(chapter_file, 'r', encoding='utf-8') as f:
-                    chapter_data = json.load(f)
-                
-                # Handle different input formats
-                if isinstance(chapter_data, dict):
-                    # If the file already has chapter structure
-                    if "chapter" in chapter_data and "verses" in chapter_data:
-                        book_data["chapters"].append(chapter_data)
-                    # If it's just a list of verses
-                    elif "verses" in chapter_data:
-                        chapter_num = self.extract_chapter_number(chapter_file.name)
-                        book_data["chapters"].append({
-                            "chapter": str(chapter_num),
-                            "verses": chapter_data["verses"]
-                        })
-                elif isinstance(chapter_data, list):
-                    # If the file is just an array of verses
-                    chapter_num = self.extract_chapter_number(chapter_file.name)
-                    book_data["chapters"].append({
-                        "chapter": str(chapter_num),
-                        "verses": chapter_data
-                    })
-                    
-            except json.JSONDecodeError as e:
-                self.log(f"  Error parsing {chapter_file.name}: {e}")
-                continue
-            except Exception as e:
-                self.log(f"  Error reading {chapter_file.name}: {e}")
-                continue
-        
         if not book_data["chapters"]:
             return None
         
@@ -250,6 +383,383 @@ class BookAggregator:
         book_data["chapters"].sort(key=lambda c: int(c.get("chapter", "0")))
         
         return book_data
+    
+    def write_book(self, book_name: str, output_file: Path) -> Dict:
+        """
+        Aggregate a book straight into its output file; returns chapter and verse counts.
+        
+        Each chapter is written as soon as it has been read, instead of
+        holding the whole book in memory, and the file is byte-identical to
+        json.dump(aggregate_book(...), indent=2). Chapter numbers inside the
+        files normally follow the file order; if one does not, the book is
+        re-aggregated in memory so that chapters are still sorted. Returns
+        None, leaving output_file untouched, when there are no chapters.
+        """
+        self.log(f"Aggregating {book_name}...")
+        
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        stats = {"chapters": 0, "verses": 0}
+        previous = None
+        in_order = True
+        
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for chapter in self.iter_chapters(book_name):
+                number = int(chapter.get("chapter", "0"))
+                if previous is not None and number < previous:
+                    in_order = False
+                    break
+                previous = number
+                
+                if stats["chapters"] == 0:
+                    f.write('{\n  "book": ' + json.dumps(book_name, ensure_ascii=False) + ',\n  "chapters": [\n')
+                else:
+                    f.write(',\n')
+                chapter_json = json.dumps(chapter, indent=2, ensure_ascii=False)
+                f.write('    ' + chapter_json.replace('\n', '\n    '))
+                stats["chapters"] += 1
+                stats["verses"] += len(chapter["verses"])
+            
+            if stats["chapters"] and in_order:
+                f.write('\n  ]\n}')
+        
+        if not in_order:
+            self.log(f"  {book_name}: chapter numbers out of file order, aggregating in memory")
+            os.remove(tmp_file)
+            book_data = self.aggregate_book(book_name)
+            write_book_json(book_data, output_file)
+            return {
+                "chapters": len(book_data["chapters"]),
+                "verses": sum(len(ch["verses"]) for ch in book_data["chapters"])
+            }
+        
+        if not stats["chapters"]:
+            os.remove(tmp_file)
+            return None
+        
+        os.replace(tmp_file, output_file)
+        return stats
+
+
+class VerificationCache:
+    """
+    Persistent per-book verification results keyed by file content hash.
+    
+    Entries are only reused when the book file's SHA-256 and the verifier
+    rule version both match, so any data or rule change forces a re-check.
+    """
+    
+    CACHE_VERSION = 2
+    
+    def __init__(self, cache_file: str):
+        self.cache_file = Path(cache_file)
+        self.books = {}
+        self.hits = 0
+        self.misses = 0
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if (data.get("cache_version") == self.CACHE_VERSION
+                and data.get("rules_version") == verse_rules.RULES_VERSION):
+            self.books = data.get("books", {})
+    
+    @staticmethod
+    def file_hash(filepath: Path) -> str:
+        """SHA-256 of a file's contents"""
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def get(self, book_name: str, file_hash: str) -> Dict:
+        """Return the cached result for this exact file content, if any"""
+        entry = self.books.get(book_name)
+        if entry and entry.get("sha256") == file_hash:
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+    
+    def put(self, book_name: str, file_hash: str, result: Dict):
+        self.books[book_name] = {"sha256": file_hash, "result": result}
+    
+    def save(self):
+        """Write the cache atomically so an interrupted run cannot corrupt it"""
+        data = {
+            "cache_version": self.CACHE_VERSION,
+            "rules_version": verse_rules.RULES_VERSION,
+            "books": self.books
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+
+class CorpusManifest:
+    """
+    Merkle-style hashes of one data directory, for comparing corpus versions.
+    
+    For every book file the manifest stores, per verse, its label and the
+    hashes of its raw and normalized text; per chapter and per book, a hash
+    over the hashes below it. A chapter's verse hashes are concatenated into
+    one string per kind (DIGEST_CHARS characters each), which keeps the
+    manifest quick to load. Equal hashes mean equal text, so a comparison
+    only needs to descend into books and chapters whose hashes differ, and
+    only reads verse text when the normalized hashes differ too.
+    
+    Book entries are kept until the file's size or modification time
+    changes, so refreshing the manifest of an unchanged directory only
+    costs a stat per book. A manifest written with another MANIFEST_VERSION
+    or BibleVerifier.NORMALIZATION_VERSION is discarded as a whole.
+    """
+    
+    MANIFEST_VERSION = 1
+    DIGEST_CHARS = 16
+    
+    def __init__(self, manifest_file: Path):
+        self.manifest_file = Path(manifest_file)
+        self.books = {}
+        self.rebuilt = 0
+        
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if (data.get("manifest_version") == self.MANIFEST_VERSION
+                and data.get("normalization_version") == BibleVerifier.NORMALIZATION_VERSION):
+            self.books = data.get("books", {})
+    
+    @classmethod
+    def for_directory(cls, manifest_dir: str, data_dir: Path) -> "CorpusManifest":
+        """The manifest kept in manifest_dir for data_dir (named after its resolved path)"""
+        resolved = str(Path(data_dir).resolve())
+        key = hashlib.sha256(resolved.encode('utf-8')).hexdigest()[:16]
+        manifest = cls(Path(manifest_dir) / f"{Path(resolved).name}-{key}.json")
+        manifest.data_dir = resolved
+        return manifest
+    
+    @staticmethod
+    def digest(data: str) -> str:
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def book(self, book_name: str, book_file: Path, normalize) -> Dict:
+        """
+        Manifest entry for a book file, rebuilt if the file changed.
+        
+        `normalize` must be the comparison's text normalization
+        (BibleVerifier.normalize_text, as versioned by NORMALIZATION_VERSION). Raises BookStreamError if the file
+        cannot be read.
+        """
+        stat = book_file.stat()
+        entry = self.books.get(book_name)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+        
+        chapters = []
+        for chapter_num, verses in iter_chapters(book_file):
+            texts = [verse.get("text", "") for verse in verses]
+            verse_raw = "".join(self.digest(text) for text in texts)
+            verse_normalized = "".join(self.digest(normalize(text)) for text in texts)
+            chapters.append({
+                "chapter": chapter_num,
+                "raw": self.digest(verse_raw),
+                "normalized": self.digest(verse_normalized),
+                "verses": [verse.get("verse", "?") for verse in verses],
+                "verse_raw": verse_raw,
+                "verse_normalized": verse_normalized
+            })
+        
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "raw": self.digest(" ".join(c["raw"] for c in chapters)),
+            "normalized": self.digest(" ".join(c["normalized"] for c in chapters)),
+            "chapters": chapters
+        }
+        self.books[book_name] = entry
+        self.rebuilt += 1
+        return entry
+    
+    def save(self):
+        """Write the manifest atomically"""
+        if not self.rebuilt and self.manifest_file.exists():
+            return
+        data = {
+            "manifest_version": self.MANIFEST_VERSION,
+            "normalization_version": BibleVerifier.NORMALIZATION_VERSION,
+            "data_dir": getattr(self, "data_dir", None),
+            "books": self.books
+        }
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, self.manifest_file)
+
+
+def _child_cpu_time() -> float:
+    """User and system CPU seconds of terminated, waited-for child processes"""
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+class PerformanceMeter:
+    """
+    Wall time, CPU time and peak traced memory of a block of work.
+    
+    CPU time includes worker processes that exited and were waited for
+    during the block (e.g. a verification process pool), reported on its
+    own as child_cpu_seconds when there were any.
+    
+    Meters nest: tracemalloc has a single peak counter, so a meter reports
+    the peak seen so far to every enclosing meter before resetting it.
+    Peak memory is measured relative to what was allocated at start().
+    """
+    
+    _active = []
+    
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stats = {}
+    
+    @classmethod
+    def _propagate_peak(cls, peak: int):
+        for meter in cls._active:
+            meter.peak = max(meter.peak, peak)
+    
+    def start(self) -> "PerformanceMeter":
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            current, peak = tracemalloc.get_traced_memory()
+            self._propagate_peak(peak)
+            tracemalloc.reset_peak()
+            self.base = self.peak = current
+        PerformanceMeter._active.append(self)
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.child_cpu_start = _child_cpu_time()
+        return self
+    
+    def stop(self) -> Dict:
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.process_time() - self.cpu_start
+        child_cpu = _child_cpu_time() - self.child_cpu_start
+        PerformanceMeter._active.remove(self)
+        self.stats = {"wall_seconds": round(wall, 4), "cpu_seconds": round(cpu + child_cpu, 4)}
+        if child_cpu > 0:
+            self.stats["child_cpu_seconds"] = round(child_cpu, 4)
+        if self.trace_memory:
+            peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            self._propagate_peak(peak)
+            self.stats["peak_memory_bytes"] = peak - self.base
+        return self.stats
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class Profiler:
+    """
+    Collects the report's "performance" section (enabled by --profile).
+    
+    Phases and the books within them are delimited with begin_phase(),
+    begin_book() and end_phase(); starting a book ends the previous one, so
+    loops that `continue` early need no extra bookkeeping. A Counter passed
+    to begin_book() is snapshotted, and the book records what it added.
+    """
+    
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = {}
+        self.books = defaultdict(dict)
+        self.counters = defaultdict(Counter)
+        self._phase = None
+        self._book = None
+    
+    def begin_phase(self, name: str):
+        if self.enabled:
+            self._phase = (name, PerformanceMeter().start())
+    
+    def begin_book(self, book_name: str, counters: Counter = None):
+        if not self.enabled:
+            return
+        self._end_book()
+        snapshot = Counter(counters) if counters is not None else None
+        self._book = (book_name, PerformanceMeter().start(), counters, snapshot)
+    
+    def _end_book(self):
+        if self._book is None:
+            return
+        book_name, meter, counters, snapshot = self._book
+        stats = meter.stop()
+        if counters is not None:
+            stats["counters"] = dict(counters - snapshot)
+        self.record_book(book_name, self._phase[0], stats)
+        self._book = None
+    
+    def record_book(self, book_name: str, phase: str, stats: Dict):
+        """Store per-book stats, e.g. ones measured in a worker process"""
+        self.books[book_name][phase] = stats
+        self.counters[phase].update(stats.get("counters", {}))
+    
+    def end_phase(self):
+        if not self.enabled or self._phase is None:
+            return
+        self._end_book()
+        name, meter = self._phase
+        self.phases[name] = meter.stop()
+        self._phase = None
+    
+    def report(self) -> Dict:
+        return {
+            "phases": self.phases,
+            "books": dict(self.books),
+            "counters": {phase: dict(counts) for phase, counts in self.counters.items() if counts},
+        }
+
+
+class IssueLog:
+    """
+    Streams issues to an NDJSON file (one JSON object per line) as they are found.
+    
+    Every record has a "type" (structural, encoding, punctuation,
+    duplicate_verse, out_of_order_verse or comparison) and a "book". The
+    last record has type "summary" and carries the report summary, so the
+    stream is complete on its own. Nothing is truncated, and only per-type
+    counts are kept in memory.
+    """
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.counts = Counter()
+        self.file = open(self.path, 'w', encoding='utf-8')
+    
+    def write(self, record_type: str, book_name: str, fields: Dict):
+        record = {"type": record_type, "book": book_name}
+        record.update(fields)
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.counts[record_type] += 1
+    
+    def write_all(self, record_type: str, book_name: str, entries: List[Dict]):
+        for entry in entries:
+            self.write(record_type, book_name, entry)
+    
+    def close(self, summary: Dict):
+        self.file.write(json.dumps({"type": "summary", "summary": summary, "records": dict(self.counts)},
+                                   ensure_ascii=False) + "\n")
+        self.file.close()
 
 
 def load_book_json(filepath: Path) -> Dict:
@@ -293,6 +803,574 @@ def verify_book_structure(book_data: Dict, book_name: str) -> List[str]:
     return issues
 
 
+def _verse_number(label) -> int:
+    """Numeric value of a verse label, or None if it is not a number"""
+    try:
+        return int(label)
+    except (TypeError, ValueError):
+        return None
+
+
+def _text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def check_verse_sequence(book_name: str, chapter_num: Any, verse_labels: List) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Find duplicated and out-of-order verse numbers in one chapter.
+    
+    Returns (duplicates, out_of_order). A per-chapter hash index of verse
+    numbers keeps this linear in the number of verses.
+    """
+    copies = {}
+    out_of_order = []
+    previous_label = None
+    previous = None
+    
+    for label in verse_labels:
+        copies[label] = copies.get(label, 0) + 1
+        number = _verse_number(label)
+        if number is not None:
+            if previous is not None and number < previous:
+                out_of_order.append({
+                    "reference": f"{book_name} {chapter_num}:{label}",
+                    "follows": previous_label
+                })
+            previous, previous_label = number, label
+    
+    duplicates = [
+        {"reference": f"{book_name} {chapter_num}:{label}", "copies": count}
+        for label, count in copies.items() if count > 1
+    ]
+    return duplicates, out_of_order
+
+
+def compact_book(book_data: Dict, book_name: str) -> Dict:
+    """
+    Remove duplicated verses and restore verse order, modifying book_data.
+    
+    For each verse number that occurs more than once in a chapter, copies
+    are dropped in this order:
+      1. exact repeats of an earlier copy with the same number
+      2. leaked copies: same number and text as a verse kept in an earlier
+         chapter (some books re-include every previous chapter's verses)
+      3. any remaining conflicting copies after the first, which are
+         reported as unresolved so they can be checked by hand
+    Once a chapter shows leaked copies, every leaked verse is dropped, even
+    where no copy of that number remains. Chapters are then stably sorted by verse number.
+    """
+    stats = {"verses_before": 0, "verses_after": 0, "removed": 0, "reordered_chapters": 0, "unresolved": []}
+    earlier_verses = set()  # (verse number, text digest) kept in previous chapters
+    
+    for chapter in book_data.get("chapters", []):
+        chapter_num = chapter.get("chapter", "?")
+        verses = chapter.get("verses", [])
+        stats["verses_before"] += len(verses)
+        
+        labels = [verse.get("verse") for verse in verses]
+        digests = [_text_digest(verse.get("text", "")) for verse in verses]
+        leaked = [(label, digest) in earlier_verses for label, digest in zip(labels, digests)]
+        
+        # Hash index: verse number -> positions of its copies
+        positions = defaultdict(list)
+        for i, label in enumerate(labels):
+            positions[label].append(i)
+        
+        contaminated = any(
+            leaked[i] for indices in positions.values() if len(indices) > 1 for i in indices
+        )
+        
+        drop = set()
+        for label, indices in positions.items():
+            if len(indices) == 1:
+                if contaminated and leaked[indices[0]]:
+                    drop.add(indices[0])
+                continue
+            
+            candidates = []
+            seen = set()
+            for i in indices:
+                if digests[i] in seen or leaked[i]:
+                    drop.add(i)
+                else:
+                    candidates.append(i)
+                seen.add(digests[i])
+            
+            # Every copy may be leaked, e.g. numbers past the chapter's own end
+            if len(candidates) > 1:
+                stats["unresolved"].append(f"{book_name} {chapter_num}:{label}")
+            drop.update(candidates[1:])
+        
+        kept = [i for i in range(len(verses)) if i not in drop]
+        
+        numbers = [_verse_number(labels[i]) for i in kept]
+        if None not in numbers and numbers != sorted(numbers):
+            kept = [i for _, i in sorted(zip(numbers, kept), key=lambda pair: pair[0])]
+            stats["reordered_chapters"] += 1
+        
+        chapter["verses"] = [verses[i] for i in kept]
+        stats["removed"] += len(verses) - len(kept)
+        stats["verses_after"] += len(kept)
+        earlier_verses.update((labels[i], digests[i]) for i in kept)
+    
+    return stats
+
+
+def iter_compacted_chapters(book_file: Path, book_name: str) -> Iterator[Tuple[Any, List[Dict]]]:
+    """
+    Yield (chapter, verses) of a book file after compact_book, without rewriting it.
+    
+    Index and report builders read books through this: some book files
+    re-include every earlier chapter's verses under later chapter numbers,
+    and without compaction those copies would be indexed or counted under
+    the wrong references. Raises BookStreamError if the file cannot be read.
+    """
+    book_data = {"chapters": [
+        {"chapter": chapter, "verses": verses}
+        for chapter, verses in iter_chapters(book_file)
+    ]}
+    compact_book(book_data, book_name)
+    for chapter in book_data["chapters"]:
+        yield chapter["chapter"], chapter["verses"]
+
+
+def write_book_json(book_data: Dict, filepath: Path):
+    """Write a book file in the repository format via temp file and rename"""
+    tmp_file = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(book_data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, filepath)
+
+
+def _write_bytes(filepath: Path, data: bytes):
+    """Write a file via temp file and rename"""
+    tmp_file = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, filepath)
+
+
+def _write_with_gzip(filepath: Path, data: bytes) -> int:
+    """Write data and a precompressed .gz sibling; returns the compressed size"""
+    _write_bytes(filepath, data)
+    # mtime=0 keeps the .gz output identical across runs
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_bytes(filepath.with_name(filepath.name + ".gz"), compressed)
+    return len(compressed)
+
+
+def _parse_ms(text: str) -> float:
+    start = time.perf_counter()
+    json.loads(text)
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def write_web_book(book_data: Dict, target_dir: Path) -> Dict:
+    """
+    Write the web output profile for one book.
+    
+    Instead of the indented book file, writes a minified <Book>.json and one
+    minified file per chapter at chapters/<Book>/<chapter>.json, each with a
+    gzip-precompressed .gz sibling, so the app can fetch a single chapter.
+    Returns sizes and parse times compared with the indented format.
+    """
+    book_name = book_data["book"]
+    indented = json.dumps(book_data, indent=2, ensure_ascii=False)
+    minified = json.dumps(book_data, separators=(',', ':'), ensure_ascii=False)
+    minified_bytes = minified.encode('utf-8')
+    
+    stats = {
+        "indented_bytes": len(indented.encode('utf-8')),
+        "minified_bytes": len(minified_bytes),
+        "gzip_bytes": _write_with_gzip(target_dir / f"{book_name}.json", minified_bytes),
+        "chapter_files": 0,
+        "largest_chapter_bytes": 0,
+        "largest_chapter_gzip_bytes": 0,
+        "indented_parse_ms": _parse_ms(indented),
+        "minified_parse_ms": _parse_ms(minified),
+        "largest_chapter_parse_ms": 0.0,
+    }
+    
+    chapter_dir = target_dir / WEB_CHAPTER_DIR / book_name
+    chapter_dir.mkdir(parents=True, exist_ok=True)
+    written = set()
+    largest = ""
+    
+    for chapter in book_data["chapters"]:
+        chapter_file = chapter_dir / f"{chapter.get('chapter', '0')}.json"
+        content = json.dumps({"book": book_name, **chapter}, separators=(',', ':'), ensure_ascii=False)
+        content_bytes = content.encode('utf-8')
+        gzip_size = _write_with_gzip(chapter_file, content_bytes)
+        written.update([chapter_file.name, chapter_file.name + ".gz"])
+        
+        stats["chapter_files"] += 1
+        if len(content_bytes) > stats["largest_chapter_bytes"]:
+            stats["largest_chapter_bytes"] = len(content_bytes)
+            stats["largest_chapter_gzip_bytes"] = gzip_size
+            largest = content
+    
+    if largest:
+        stats["largest_chapter_parse_ms"] = _parse_ms(largest)
+    
+    # Remove chapter files left over from a previous run with more chapters
+    for stale in chapter_dir.iterdir():
+        if stale.name not in written:
+            stale.unlink()
+    
+    return stats
+
+
+def verify_book(book_file: Path, book_name: str, counters: Counter = None) -> Dict:
+    """
+    Run structural, encoding and punctuation checks for a single book file.
+    
+    The file is streamed verse by verse, so memory stays bounded however
+    large the book is. Issues match verify_book_structure on the loaded data.
+    If `counters` is given, per-check counts are added to it.
+    """
+    if not book_file.exists():
+        return None
+    if counters is None:
+        counters = Counter()
+    
+    verifier = BibleVerifier()
+    chapter_issues = []
+    encoding_issues = []
+    punctuation_issues = []
+    duplicate_verses = []
+    out_of_order_verses = []
+    chapter_count = 0
+    verse_labels = []
+    
+    try:
+        for kind, chapter_num, payload in iter_book_events(book_file):
+            if kind == "chapter":
+                chapter_count += 1
+                counters["chapters"] += 1
+                if not payload:
+                    chapter_issues.append(f"{book_name} {chapter_num}: No verses found")
+                duplicates, out_of_order = check_verse_sequence(book_name, chapter_num, verse_labels)
+                counters["duplicate_verses"] += len(duplicates)
+                counters["out_of_order_verses"] += len(out_of_order)
+                duplicate_verses.extend(duplicates)
+                out_of_order_verses.extend(out_of_order)
+                verse_labels = []
+                continue
+            if kind != "verse":
+                continue
+            
+            verse_labels.append(payload.get("verse"))
+            verse_num = payload.get("verse", "?")
+            text = payload.get("text", "")
+            reference = f"{book_name} {chapter_num}:{verse_num}"
+            counters["verses"] += 1
+            
+            # Check for empty verse text
+            if not text.strip():
+                counters["empty_verses"] += 1
+                chapter_issues.append(f"{book_name} {chapter_num}:{verse_num}: Empty verse text")
+            
+            enc_issues = verifier.check_encoding(text)
+            if enc_issues:
+                counters["encoding_flagged"] += 1
+                encoding_issues.append({"reference": reference, "issues": enc_issues})
+            
+            punct_issues = verifier.check_punctuation(text)
+            if punct_issues:
+                counters["punctuation_flagged"] += 1
+                punctuation_issues.append({"reference": reference, "issues": punct_issues})
+    except BookStreamError as e:
+        print(f"Error loading {e}")
+        return {
+            "issues": [f"{book_name}: Failed to load book data"],
+            "encoding_issues": [],
+            "punctuation_issues": [],
+            "duplicate_verses": [],
+            "out_of_order_verses": []
+        }
+    
+    issues = []
+    
+    # Check expected chapter count
+    if book_name in KJV_CHAPTER_COUNTS:
+        expected_chapters = KJV_CHAPTER_COUNTS[book_name]
+        if chapter_count != expected_chapters:
+            issues.append(f"{book_name}: Expected {expected_chapters} chapters, found {chapter_count}")
+    
+    issues.extend(chapter_issues)
+    
+    return {
+        "issues": issues,
+        "encoding_issues": encoding_issues,
+        "punctuation_issues": punctuation_issues,
+        "duplicate_verses": duplicate_verses,
+        "out_of_order_verses": out_of_order_verses
+    }
+
+
+def _verify_book_task(task: Tuple[str, str, bool]) -> Tuple[Dict, Dict]:
+    """Process pool entry point for verify_book; returns (result, performance)"""
+    book_file, book_name, profile = task
+    if not profile:
+        return verify_book(Path(book_file), book_name), None
+    
+    counters = Counter()
+    with PerformanceMeter() as meter:
+        result = verify_book(Path(book_file), book_name, counters)
+    return result, dict(meter.stats, counters=dict(counters))
+
+
+def verify_books(books: List[str], target_dir: Path, jobs: int = 1,
+                 cache: VerificationCache = None, profiler: Profiler = None) -> Iterator[Tuple[str, Dict]]:
+    """
+    Verify a list of books, optionally in a process pool.
+    
+    Yields (book_name, result) in the same order as `books` regardless of
+    which worker finishes first, so reports are identical to a serial run.
+    Each result is yielded as soon as it and every earlier book are done,
+    so callers can handle one book at a time; result is None for a missing
+    file. With a cache, only books whose content changed since the last run
+    are verified. With an enabled profiler, each verified book is measured
+    where it runs (in the worker process when jobs > 1).
+    """
+    profile = bool(profiler and profiler.enabled)
+    cached_results = {}
+    tasks = []
+    file_hashes = {}
+    
+    for index, book_name in enumerate(books):
+        book_file = target_dir / f"{book_name}.json"
+        if cache and book_file.exists():
+            file_hashes[index] = cache.file_hash(book_file)
+            cached = cache.get(book_name, file_hashes[index])
+            if cached is not None:
+                cached_results[index] = cached
+                continue
+        tasks.append((str(book_file), book_name, profile))
+    
+    executor = None
+    if jobs <= 1 or len(tasks) <= 1:
+        task_results = map(_verify_book_task, tasks)
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(tasks)))
+        # Bigger chunks cut IPC overhead for the many small NT books
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        task_results = executor.map(_verify_book_task, tasks, chunksize=chunksize)
+    
+    try:
+        for index, book_name in enumerate(books):
+            if index in cached_results:
+                if profile:
+                    profiler.record_book(book_name, "verification", {"cached": True})
+                yield book_name, cached_results.pop(index)
+                continue
+            
+            result, performance = next(task_results)
+            if performance:
+                profiler.record_book(book_name, "verification", performance)
+            if cache and result is not None and index in file_hashes:
+                cache.put(book_name, file_hashes[index], result)
+            yield book_name, result
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+def iter_book_differences(verifier: BibleVerifier, target_file: Path, compare_file: Path,
+                          book_name: str) -> Iterator[Dict]:
+    """
+    Yield each difference between two book files, in order.
+    
+    Both files are walked one chapter at a time instead of being loaded
+    whole, and nothing is kept once yielded. Raises BookStreamError if
+    either file cannot be read.
+    """
+    compare_chapters = iter_chapters(compare_file)
+    for ch_idx, (chapter_num, verses) in enumerate(iter_chapters(target_file)):
+        compare_chapter = next(compare_chapters, None)
+        if compare_chapter is None:
+            yield {"issue": f"Chapter {ch_idx + 1} exists in target but not in comparison"}
+            return
+        
+        compare_verses = compare_chapter[1]
+        
+        for v_idx, verse in enumerate(verses):
+            if v_idx >= len(compare_verses):
+                yield {"issue": f"Verse {chapter_num}:{v_idx + 1} exists in target but not in comparison"}
+                break
+            
+            compare_verse = compare_verses[v_idx]
+            verse_num = verse.get("verse", "?")
+            
+            diff = verifier.compare_verses(verse, compare_verse, book_name, chapter_num, verse_num)
+            if not diff["identical"]:
+                yield diff
+
+
+def iter_manifest_differences(verifier: BibleVerifier, target_entry: Dict, compare_entry: Dict,
+                              target_file: Path, compare_file: Path, book_name: str) -> Iterator[Dict]:
+    """
+    Yield the same differences as iter_book_differences, guided by manifests.
+    
+    Books and chapters with equal raw hashes are skipped, verses with equal
+    raw hashes are identical, and verses with equal normalized hashes differ
+    only in Strong's numbers or formatting. Only chapters holding a verse
+    whose normalized text differs are read from the files, in one forward
+    pass over both of them.
+    """
+    if target_entry["raw"] == compare_entry["raw"]:
+        return
+    
+    compare_chapters = compare_entry["chapters"]
+    streams = None
+    
+    for ch_idx, chapter in enumerate(target_entry["chapters"]):
+        if ch_idx >= len(compare_chapters):
+            yield {"issue": f"Chapter {ch_idx + 1} exists in target but not in comparison"}
+            return
+        
+        compare_chapter = compare_chapters[ch_idx]
+        if chapter["raw"] == compare_chapter["raw"]:
+            continue
+        
+        chapter_num = chapter["chapter"]
+        compare_count = len(compare_chapter["verses"])
+        width = CorpusManifest.DIGEST_CHARS
+        texts = None
+        
+        for v_idx, verse_num in enumerate(chapter["verses"]):
+            if v_idx >= compare_count:
+                yield {"issue": f"Verse {chapter_num}:{v_idx + 1} exists in target but not in comparison"}
+                break
+            
+            digest = slice(v_idx * width, (v_idx + 1) * width)
+            if chapter["verse_raw"][digest] == compare_chapter["verse_raw"][digest]:
+                continue
+            
+            if chapter["verse_normalized"][digest] == compare_chapter["verse_normalized"][digest]:
+                verifier.counters["formatting_only"] += 1
+                yield {
+                    "book": book_name,
+                    "chapter": chapter_num,
+                    "verse": verse_num,
+                    "identical": False,
+                    "differences": ["Only Strong's numbers or formatting differ"]
+                }
+                continue
+            
+            # The texts are needed: read this chapter from both files
+            if texts is None:
+                if streams is None:
+                    streams = enumerate(zip(iter_chapters(target_file), iter_chapters(compare_file)))
+                for index, ((_, verses), (_, reference_verses)) in streams:
+                    if index == ch_idx:
+                        texts = (verses, reference_verses)
+                        break
+            
+            diff = verifier.compare_verses(texts[0][v_idx], texts[1][v_idx], book_name, chapter_num, verse_num)
+            if not diff["identical"]:
+                yield diff
+
+
+def write_aggregated_book(aggregator: BookAggregator, book_name: str, target_dir: Path,
+                          emit: str = "standard") -> Dict:
+    """
+    Aggregate one book into target_dir in the given --emit format.
+    
+    Returns {"chapters", "verses"} (plus "web_output" stats for web), or
+    None when the book has no chapter files. Standard output is streamed
+    chapter by chapter when the aggregator reads in threads.
+    """
+    output_file = target_dir / f"{book_name}.json"
+    if emit == "standard" and aggregator.executor:
+        return aggregator.write_book(book_name, output_file)
+    
+    book_data = aggregator.aggregate_book(book_name)
+    if not book_data:
+        return None
+    
+    counts = {
+        "chapters": len(book_data["chapters"]),
+        "verses": sum(len(ch["verses"]) for ch in book_data["chapters"])
+    }
+    if emit == "web":
+        counts["web_output"] = write_web_book(book_data, target_dir)
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(book_data, f, indent=2, ensure_ascii=False)
+    return counts
+
+
+def watch_source(aggregator: BookAggregator, books: List[str], target_dir: Path,
+                 emit: str = "standard", interval: float = 1.0, verify: bool = True,
+                 snapshots: Dict[str, Dict] = None):
+    """
+    Poll the source directory and rebuild only the books whose chapters changed.
+    
+    Each poll rescans the directory once and compares every book's chapter
+    files by (mtime, size), so added, removed and edited chapters are all
+    noticed. Changed books are re-aggregated and, with `verify`, re-verified;
+    other books are not touched. Runs until interrupted with Ctrl+C.
+    
+    `snapshots` should hold each book's snapshot_book() from just before it
+    was first aggregated, so changes made while the first run was still
+    going are rebuilt on the first poll. Without it, the source is rescanned
+    and the baseline is taken now.
+    """
+    if snapshots is None:
+        aggregator.rescan()
+        snapshots = {book_name: aggregator.snapshot_book(book_name) for book_name in books}
+    else:
+        snapshots = dict(snapshots)
+    print(f"\n=== Watching {aggregator.source_dir} (every {interval:g}s, Ctrl+C to stop) ===")
+    
+    try:
+        while True:
+            time.sleep(interval)
+            aggregator.rescan()
+            
+            for book_name in books:
+                snapshot = aggregator.snapshot_book(book_name)
+                if snapshot == snapshots[book_name]:
+                    continue
+                snapshots[book_name] = snapshot
+                
+                start = time.perf_counter()
+                counts = write_aggregated_book(aggregator, book_name, target_dir, emit)
+                if not counts:
+                    print(f"✗ {book_name}: No data found")
+                    continue
+                
+                line = f"{book_name}: {counts['chapters']} chapters, {counts['verses']} verses"
+                result = verify_book(target_dir / f"{book_name}.json", book_name) if verify else None
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                
+                if result is None:
+                    print(f"✓ {line} ({elapsed_ms:.0f} ms)")
+                    continue
+                
+                problems = []
+                if result["issues"]:
+                    problems.append(f"{len(result['issues'])} structural")
+                if result["encoding_issues"]:
+                    problems.append(f"{len(result['encoding_issues'])} encoding")
+                if result["punctuation_issues"]:
+                    problems.append(f"{len(result['punctuation_issues'])} punctuation")
+                if result["duplicate_verses"]:
+                    problems.append(f"{len(result['duplicate_verses'])} duplicated")
+                if result["out_of_order_verses"]:
+                    problems.append(f"{len(result['out_of_order_verses'])} out of order")
+                
+                if problems:
+                    print(f"⚠ {line}: {', '.join(problems)} ({elapsed_ms:.0f} ms)")
+                    for issue in result["issues"]:
+                        print(f"  - {issue}")
+                else:
+                    print(f"✓ {line}: OK ({elapsed_ms:.0f} ms)")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Aggregate and verify Bible JSON data")
     parser.add_argument("--source", help="Source directory containing per-chapter files")
@@ -303,16 +1381,36 @@ def main():
     parser.add_argument("--book", help="Process only a specific book (for testing)")
     parser.add_argument("--aggregate-only", action="store_true", help="Only aggregate, skip verification")
     parser.add_argument("--verify-only", action="store_true", help="Only verify existing files, skip aggregation")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes for verification (default: 1)")
+    parser.add_argument("--compact", action="store_true", help="Remove duplicated verses and fix verse order in target files before verifying")
+    parser.add_argument("--cache", help="Verification cache file; unchanged books are not re-verified")
+    parser.add_argument("--emit", choices=["standard", "web"], default="standard",
+                        help="Aggregation output: indented book files (standard) or minified book and chapter files with .gz siblings (web)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record per-phase and per-book time, CPU, peak memory and counters in the report")
+    parser.add_argument("--read-threads", type=int, default=0,
+                        help="Read chapter files in N threads and stream each book to its file as chapters arrive")
+    parser.add_argument("--watch", action="store_true",
+                        help="After the run, keep polling --source and rebuild only books whose chapter files change")
+    parser.add_argument("--watch-interval", type=float, default=1.0, help="Seconds between --watch polls (default: 1)")
+    parser.add_argument("--manifests", help="Directory for hash manifests of --target and --compare; "
+                        "comparison then only reads chapters whose hashes differ")
+    parser.add_argument("--issues-log", help="Stream every issue to this NDJSON file; the report keeps only counts")
     
     args = parser.parse_args()
+    if args.watch and (not args.source or args.verify_only):
+        parser.error("--watch needs --source and cannot be combined with --verify-only")
     
     verifier = BibleVerifier(verbose=args.verbose)
+    profiler = Profiler(args.profile)
     report = {
         "aggregation": {},
         "verification": {},
         "comparison": {},
         "encoding_issues": {},
         "punctuation_issues": {},
+        "duplicate_verses": {},
+        "out_of_order_verses": {},
         "summary": {}
     }
     
@@ -322,94 +1420,166 @@ def main():
     # Phase 1: Aggregation
     if args.source and not args.verify_only:
         print("=== Phase 1: Aggregating per-chapter files ===")
-        aggregator = BookAggregator(args.source, verbose=args.verbose)
+        aggregator = BookAggregator(args.source, verbose=args.verbose, read_threads=args.read_threads)
         target_dir = Path(args.target)
         target_dir.mkdir(parents=True, exist_ok=True)
         
+        if args.emit == "web":
+            report["web_output"] = {}
+        
+        # Taken before each book is built, so --watch rebuilds it if it changes later
+        snapshots = {}
+        profiler.begin_phase("aggregation")
         for book_name in books_to_process:
-            book_data = aggregator.aggregate_book(book_name)
-            if book_data:
-                output_file = target_dir / f"{book_name}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(book_data, f, indent=2, ensure_ascii=False)
-                
-                chapter_count = len(book_data["chapters"])
-                verse_count = sum(len(ch["verses"]) for ch in book_data["chapters"])
-                print(f"✓ {book_name}: {chapter_count} chapters, {verse_count} verses")
+            profiler.begin_book(book_name)
+            if args.watch:
+                snapshots[book_name] = aggregator.snapshot_book(book_name)
+            counts = write_aggregated_book(aggregator, book_name, target_dir, args.emit)
+            if counts and "web_output" in counts:
+                report["web_output"][book_name] = counts.pop("web_output")
+            
+            if counts:
+                print(f"✓ {book_name}: {counts['chapters']} chapters, {counts['verses']} verses")
                 report["aggregation"][book_name] = {
                     "status": "success",
-                    "chapters": chapter_count,
-                    "verses": verse_count
+                    "chapters": counts["chapters"],
+                    "verses": counts["verses"]
                 }
             else:
                 print(f"✗ {book_name}: No data found")
                 report["aggregation"][book_name] = {"status": "failed", "reason": "no data found"}
+        profiler.end_phase()
+        if not args.watch:
+            aggregator.close()  # --watch keeps using it after the run
+        
+        if report.get("web_output"):
+            web = report["web_output"].values()
+            indented = sum(stats["indented_bytes"] for stats in web)
+            minified = sum(stats["minified_bytes"] for stats in web)
+            compressed = sum(stats["gzip_bytes"] for stats in web)
+            largest = max(web, key=lambda stats: stats["largest_chapter_bytes"])
+            print(f"\nWeb output: {indented:,} bytes indented → {minified:,} minified → {compressed:,} gzip")
+            print(f"  Parse time: {sum(stats['indented_parse_ms'] for stats in web):.1f} ms indented, "
+                  f"{sum(stats['minified_parse_ms'] for stats in web):.1f} ms minified")
+            print(f"  Largest chapter: {largest['largest_chapter_bytes']:,} bytes "
+                  f"({largest['largest_chapter_gzip_bytes']:,} gzip)")
     
     if args.aggregate_only:
         print("\n=== Aggregation Complete ===")
+        if profiler.enabled:
+            report["performance"] = profiler.report()
         with open(args.output, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
+        if args.watch:
+            watch_source(aggregator, books_to_process, target_dir, args.emit, args.watch_interval, verify=False,
+                         snapshots=snapshots)
+            aggregator.close()
         return
     
+    target_dir = Path(args.target)
+    
+    # Optional: rewrite books with duplicated or out-of-order verses
+    if args.compact:
+        print("\n=== Compacting book files ===")
+        report["compaction"] = {}
+        
+        profiler.begin_phase("compaction")
+        for book_name in books_to_process:
+            profiler.begin_book(book_name)
+            book_file = target_dir / f"{book_name}.json"
+            if not book_file.exists():
+                continue
+            
+            book_data = load_book_json(book_file)
+            if not book_data:
+                continue
+            
+            stats = compact_book(book_data, book_name)
+            if not stats["removed"] and not stats["reordered_chapters"]:
+                continue
+            
+            write_book_json(book_data, book_file)
+            print(f"✂ {book_name}: {stats['verses_before']} → {stats['verses_after']} verses")
+            for reference in stats["unresolved"]:
+                print(f"  - {reference}: conflicting copies, kept the first")
+            report["compaction"][book_name] = stats
+        profiler.end_phase()
+    
+    # With an issue log, issues go to the stream instead of the report
+    issue_log = IssueLog(args.issues_log) if args.issues_log else None
+    
     # Phase 2: Verification
     print("\n=== Phase 2: Verifying book structures ===")
-    target_dir = Path(args.target)
-    all_issues = []
+    total_verification_issues = 0
     total_encoding_issues = 0
     total_punctuation_issues = 0
+    total_duplicate_verses = 0
+    total_out_of_order_verses = 0
     
-    for book_name in books_to_process:
-        book_file = target_dir / f"{book_name}.json"
-        if not book_file.exists():
+    cache = VerificationCache(args.cache) if args.cache else None
+    profiler.begin_phase("verification")
+    # Each book's issues are reported and logged before the next is taken
+    for book_name, result in verify_books(books_to_process, target_dir, args.jobs, cache, profiler):
+        if result is None:
             print(f"⚠ {book_name}: File not found")
             continue
         
-        book_data = load_book_json(book_file)
-        issues = verify_book_structure(book_data, book_name)
-        
+        issues = result["issues"]
         if issues:
             print(f"⚠ {book_name}:")
             for issue in issues:
                 print(f"  - {issue}")
-            all_issues.extend(issues)
-            report["verification"][book_name] = {"status": "issues", "issues": issues}
+            total_verification_issues += len(issues)
+            if issue_log:
+                for issue in issues:
+                    issue_log.write("structural", book_name, {"issue": issue})
+                report["verification"][book_name] = {"status": "issues", "issue_count": len(issues)}
+            else:
+                report["verification"][book_name] = {"status": "issues", "issues": issues}
         else:
             print(f"✓ {book_name}: OK")
             report["verification"][book_name] = {"status": "ok"}
         
-        # Check encoding and punctuation for each verse
-        encoding_issues = []
-        punctuation_issues = []
+        encoding_issues = result["encoding_issues"]
+        punctuation_issues = result["punctuation_issues"]
+        duplicate_verses = result["duplicate_verses"]
+        out_of_order_verses = result["out_of_order_verses"]
         
-        for chapter in book_data.get("chapters", []):
-            chapter_num = chapter.get("chapter", "?")
-            for verse in chapter.get("verses", []):
-                verse_num = verse.get("verse", "?")
-                text = verse.get("text", "")
-                
-                enc_issues = verifier.check_encoding(text)
-                if enc_issues:
-                    encoding_issues.append({
-                        "reference": f"{book_name} {chapter_num}:{verse_num}",
-                        "issues": enc_issues
-                    })
-                
-                punct_issues = verifier.check_punctuation(text)
-                if punct_issues:
-                    punctuation_issues.append({
-                        "reference": f"{book_name} {chapter_num}:{verse_num}",
-                        "issues": punct_issues
-                    })
+        if issue_log:
+            issue_log.write_all("encoding", book_name, encoding_issues)
+            issue_log.write_all("punctuation", book_name, punctuation_issues)
+            issue_log.write_all("duplicate_verse", book_name, duplicate_verses)
+            issue_log.write_all("out_of_order_verse", book_name, out_of_order_verses)
         
         if encoding_issues:
             print(f"  Encoding issues: {len(encoding_issues)}")
-            report["encoding_issues"][book_name] = encoding_issues[:10]  # First 10
+            if not issue_log:
+                report["encoding_issues"][book_name] = encoding_issues[:10]  # First 10
             total_encoding_issues += len(encoding_issues)
         
         if punctuation_issues:
             print(f"  Punctuation issues: {len(punctuation_issues)}")
-            report["punctuation_issues"][book_name] = punctuation_issues[:10]  # First 10
+            if not issue_log:
+                report["punctuation_issues"][book_name] = punctuation_issues[:10]  # First 10
             total_punctuation_issues += len(punctuation_issues)
+        
+        if duplicate_verses:
+            extra_copies = sum(entry["copies"] - 1 for entry in duplicate_verses)
+            print(f"  Duplicate verses: {extra_copies} extra copies of {len(duplicate_verses)} verses")
+            if not issue_log:
+                report["duplicate_verses"][book_name] = duplicate_verses[:10]  # First 10
+            total_duplicate_verses += extra_copies
+        
+        if out_of_order_verses:
+            print(f"  Out-of-order verses: {len(out_of_order_verses)}")
+            if not issue_log:
+                report["out_of_order_verses"][book_name] = out_of_order_verses[:10]  # First 10
+            total_out_of_order_verses += len(out_of_order_verses)
+    profiler.end_phase()
+    
+    if cache:
+        cache.save()
+        print(f"Cache: {cache.hits} book(s) reused, {cache.misses} verified")
     
     # Phase 3: Comparison (if compare directory provided)
     if args.compare:
@@ -417,7 +1587,14 @@ def main():
         compare_dir = Path(args.compare)
         differences_found = 0
         
+        profiler.begin_phase("comparison")
+        manifests = None
+        if args.manifests:
+            manifests = (CorpusManifest.for_directory(args.manifests, target_dir),
+                         CorpusManifest.for_directory(args.manifests, compare_dir))
+        
         for book_name in books_to_process:
+            profiler.begin_book(book_name, counters=verifier.counters)
             target_file = target_dir / f"{book_name}.json"
             compare_file = compare_dir / f"{book_name}.json"
             
@@ -428,60 +1605,71 @@ def main():
                 print(f"⚠ {book_name}: No comparison file found")
                 continue
             
-            target_data = load_book_json(target_file)
-            compare_data = load_book_json(compare_file)
+            samples = []
+            book_differences = 0
             
-            if not target_data or not compare_data:
+            try:
+                if manifests:
+                    target_manifest, compare_manifest = manifests
+                    differences = iter_manifest_differences(
+                        verifier,
+                        target_manifest.book(book_name, target_file, verifier.normalize_text),
+                        compare_manifest.book(book_name, compare_file, verifier.normalize_text),
+                        target_file, compare_file, book_name
+                    )
+                else:
+                    differences = iter_book_differences(verifier, target_file, compare_file, book_name)
+                
+                for diff in differences:
+                    book_differences += 1
+                    if len(samples) < 5:  # First 5 differences
+                        samples.append(diff)
+                    if issue_log:
+                        issue_log.write("comparison", book_name, diff)
+                    # Past the samples, unlogged differences are only counted
+                    verifier.exact_similarity = issue_log is not None or len(samples) < 5
+            except BookStreamError as e:
+                print(f"Error loading {e}")
                 continue
+            finally:
+                verifier.exact_similarity = True
             
-            book_diffs = []
+            differences_found += book_differences
             
-            # Compare each verse
-            for ch_idx, chapter in enumerate(target_data.get("chapters", [])):
-                if ch_idx >= len(compare_data.get("chapters", [])):
-                    book_diffs.append({
-                        "issue": f"Chapter {ch_idx + 1} exists in target but not in comparison"
-                    })
-                    break
-                
-                compare_chapter = compare_data["chapters"][ch_idx]
-                chapter_num = chapter.get("chapter", "?")
-                
-                for v_idx, verse in enumerate(chapter.get("verses", [])):
-                    if v_idx >= len(compare_chapter.get("verses", [])):
-                        book_diffs.append({
-                            "issue": f"Verse {chapter_num}:{v_idx + 1} exists in target but not in comparison"
-                        })
-                        break
-                    
-                    compare_verse = compare_chapter["verses"][v_idx]
-                    verse_num = verse.get("verse", "?")
-                    
-                    diff = verifier.compare_verses(verse, compare_verse, book_name, chapter_num, verse_num)
-                    if not diff["identical"]:
-                        book_diffs.append(diff)
-                        differences_found += 1
-            
-            if book_diffs:
-                print(f"⚠ {book_name}: {len(book_diffs)} differences found")
+            if book_differences:
+                print(f"⚠ {book_name}: {book_differences} differences found")
                 report["comparison"][book_name] = {
-                    "differences": len(book_diffs),
-                    "samples": book_diffs[:5]  # First 5 differences
+                    "differences": book_differences,
+                    "samples": samples
                 }
             else:
                 print(f"✓ {book_name}: All verses match")
                 report["comparison"][book_name] = {"differences": 0}
+        profiler.end_phase()
+        
+        if manifests:
+            for manifest in manifests:
+                manifest.save()
+            print(f"Manifests: {manifests[0].rebuilt + manifests[1].rebuilt} book(s) hashed, "
+                  f"saved to {args.manifests}")
     
     # Generate summary
     report["summary"] = {
         "books_processed": len(books_to_process),
         "books_verified": sum(1 for book_name in books_to_process if (target_dir / f"{book_name}.json").exists()),
         "aggregation_successful": sum(1 for v in report["aggregation"].values() if v.get("status") == "success"),
-        "verification_issues": len(all_issues),
+        "verification_issues": total_verification_issues,
         "encoding_issues_total": total_encoding_issues,
         "punctuation_issues_total": total_punctuation_issues,
+        "duplicate_verses_total": total_duplicate_verses,
+        "out_of_order_verses_total": total_out_of_order_verses,
         "comparison_differences": sum(v.get("differences", 0) for v in report["comparison"].values())
     }
+    if profiler.enabled:
+        report["performance"] = profiler.report()
+    if issue_log:
+        issue_log.close(report["summary"])
+        report["issues_log"] = {"path": str(issue_log.path), "records": dict(issue_log.counts)}
     
     # Save report
     output_path = Path(args.output)
@@ -496,10 +1684,24 @@ def main():
     print(f"Structural verification issues: {report['summary']['verification_issues']}")
     print(f"Encoding issues found: {report['summary']['encoding_issues_total']}")
     print(f"Punctuation issues found: {report['summary']['punctuation_issues_total']}")
+    print(f"Duplicate verse copies found: {report['summary']['duplicate_verses_total']}")
+    print(f"Out-of-order verses found: {report['summary']['out_of_order_verses_total']}")
+    if report.get("compaction"):
+        removed = sum(stats["removed"] for stats in report["compaction"].values())
+        print(f"Books compacted: {len(report['compaction'])} ({removed} verses removed)")
     if report["comparison"]:
         print(f"Comparison differences: {report['summary']['comparison_differences']}")
+    for phase, stats in profiler.phases.items():
+        workers = f" ({stats['child_cpu_seconds']:.2f}s in workers)" if "child_cpu_seconds" in stats else ""
+        print(f"Phase {phase}: {stats['wall_seconds']:.2f}s wall, {stats['cpu_seconds']:.2f}s CPU{workers}, "
+              f"{stats['peak_memory_bytes'] / 1e6:.1f} MB peak")
     print(f"\nDetailed report saved to: {args.output}")
     
+    if args.watch:
+        watch_source(aggregator, books_to_process, target_dir, args.emit, args.watch_interval,
+                     snapshots=snapshots)
+        aggregator.close()
+    
     # Return exit code based on critical issues
     if report['summary']['verification_issues'] > 0:
         print("\n⚠ Critical structural issues found!")
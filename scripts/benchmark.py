@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for the Data Pipeline Scripts
+
+Generates synthetic corpora shaped like public/data (same books and chapter
+counts, Strong's tags, <em> markup) at 1x to 100x the size of the KJV, and
+times each stage separately:
+
+    aggregate_book          BookAggregator.aggregate_book over per-chapter files
+    verify_book_structure   structure and chapter/verse count checks
+    check_encoding          BibleVerifier.check_encoding on every verse
+    check_punctuation       BibleVerifier.check_punctuation on every verse
+    compare_verses          BibleVerifier.compare_verses against a reference copy
+    verify_bible_book       verify_bible_book.py against the reference copy
+    add_strongs_to_verse    tagging untagged verses from synthetic gloss data
+
+Scaling multiplies the verses per chapter, so chapter counts still match
+KJV_CHAPTER_COUNTS. Each stage holds one book at a time, so peak memory is
+about one book's verse and issue lists times the scale rather than the
+whole corpus; disk use is roughly 20 MB per 1x while a scale runs.
+
+Results are written as JSON; pass a previous results file as --baseline to
+report regressions.
+
+Usage:
+    python3 scripts/benchmark.py
+    python3 scripts/benchmark.py --scales 1,10,100 --output benchmark_results.json
+    python3 scripts/benchmark.py --baseline benchmark_results.json --output new_results.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from add_strongs import add_strongs_to_verse
+from aggregate_and_verify import (KJV_CHAPTER_COUNTS, BibleVerifier, BookAggregator,
+                                  load_book_json, verify_book_structure, write_book_json)
+from verify_bible_book import verify_bible_book
+
+RESULTS_VERSION = 1
+NT_START = list(KJV_CHAPTER_COUNTS).index("Matthew")
+
+WORDS = (
+    "and the of to that in he shall unto for i his a lord they be is him not them it with "
+    "all thou thy was god which my me said but ye their have will thee from as are when this "
+    "out were upon man by you israel king son up there hath then people came had house into "
+    "her come one we children before your also day land men against shalt go every no "
+    "father even let hand saying things over made earth now because sons thus name David "
+    "Jerusalem Moses Egypt Judah heaven spirit word law covenant glory mercy righteousness"
+).split()
+EM_WORDS = ["is", "was", "are", "were", "shall be", "thing", "men", "that is"]
+TAG_PATTERN = re.compile(r"([\w']+)\[([HG]\d+)\]")
+
+
+def _verse_text(rng: random.Random, prefix: str, max_number: int) -> str:
+    """One synthetic verse with Strong's tags and occasional <em> markup"""
+    words = []
+    for _ in range(rng.randint(8, 40)):
+        word = rng.choice(WORDS)
+        if len(word) > 3 and rng.random() < 0.6:
+            word = f"{word}[{prefix}{rng.randint(1, max_number)}]"
+        elif rng.random() < 0.04:
+            word = f"<em>{rng.choice(EM_WORDS)}</em>"
+        words.append(word)
+        if rng.random() < 0.08:
+            words[-1] += rng.choice([",", ",", ";", ":"])
+    text = " ".join(words)
+    text = text[0].upper() + text[1:] + "."
+    # A small share of verses carry the issues the checks look for
+    if rng.random() < 0.005:
+        text = text.replace(" ", "  ", 1)
+    if rng.random() < 0.005:
+        text = text.replace(",", " ,", 1)
+    return text
+
+
+def _reference_text(rng: random.Random, text: str) -> str:
+    """Untagged reference text, with about 2% of verses changed"""
+    plain = re.sub(r"\[[HG]\d+\]|</?em>", "", text)
+    if rng.random() < 0.02:
+        words = plain.split()
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+        plain = " ".join(words)
+    return plain
+
+
+def generate_corpus(work_dir: Path, scale: int, seed: int) -> Dict:
+    """
+    Write per-chapter source files (work_dir/source/<Book>_<n>.json) and
+    book-level reference files (work_dir/reference/<Book>.json)
+    """
+    rng = random.Random(seed)
+    source_dir = work_dir / "source"
+    reference_dir = work_dir / "reference"
+    source_dir.mkdir(parents=True, exist_ok=True)
+    reference_dir.mkdir(parents=True, exist_ok=True)
+    stats = {"books": 0, "chapters": 0, "verses": 0, "bytes": 0}
+
+    for book_index, (book_name, chapter_count) in enumerate(KJV_CHAPTER_COUNTS.items()):
+        prefix, max_number = ("G", 5624) if book_index >= NT_START else ("H", 8674)
+        reference = {"book": book_name, "chapters": []}
+
+        for chapter in range(1, chapter_count + 1):
+            verses = [
+                {"verse": str(verse), "text": _verse_text(rng, prefix, max_number)}
+                for verse in range(1, rng.randint(12, 40) * scale + 1)
+            ]
+            chapter_file = source_dir / f"{book_name}_{chapter}.json"
+            with open(chapter_file, 'w', encoding='utf-8') as f:
+                json.dump({"chapter": str(chapter), "verses": verses}, f, indent=2, ensure_ascii=False)
+            stats["bytes"] += chapter_file.stat().st_size
+            reference["chapters"].append({
+                "chapter": str(chapter),
+                "verses": [{"verse": v["verse"], "text": _reference_text(rng, v["text"])} for v in verses],
+            })
+            stats["chapters"] += 1
+            stats["verses"] += len(verses)
+
+        write_book_json(reference, reference_dir / f"{book_name}.json")
+        stats["books"] += 1
+
+    return stats
+
+
+class Timer:
+    """Accumulates time spent in `with timer:` blocks"""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.seconds += time.perf_counter() - self.start
+
+
+def _result(timer: Timer, items: int) -> Dict:
+    return {
+        "seconds": round(timer.seconds, 4),
+        "items": items,
+        "items_per_second": round(items / timer.seconds, 1) if timer.seconds else None,
+    }
+
+
+def run_scale(work_dir: Path, scale: int, seed: int, verbose=False) -> Dict:
+    """Generate one corpus and time every stage; items are verses throughout"""
+    start = time.perf_counter()
+    corpus = generate_corpus(work_dir, scale, seed)
+    corpus["generate_seconds"] = round(time.perf_counter() - start, 2)
+    if verbose:
+        print(f"  Generated {corpus['verses']:,} verses in {corpus['generate_seconds']}s")
+
+    source_dir = work_dir / "source"
+    target_dir = work_dir / "target"
+    reference_dir = work_dir / "reference"
+    target_dir.mkdir(exist_ok=True)
+    books = list(KJV_CHAPTER_COUNTS)
+    verifier = BibleVerifier()
+    timers = {name: Timer() for name in [
+        "aggregate_book", "verify_book_structure", "check_encoding", "check_punctuation",
+        "compare_verses", "verify_bible_book", "add_strongs_to_verse",
+    ]}
+    verses_total = 0
+
+    aggregator = BookAggregator(str(source_dir))
+    for book_name in books:
+        with timers["aggregate_book"]:
+            book_data = aggregator.aggregate_book(book_name)
+        write_book_json(book_data, target_dir / f"{book_name}.json")
+
+    for book_name in books:
+        book_file = target_dir / f"{book_name}.json"
+        reference_file = reference_dir / f"{book_name}.json"
+        book_data = load_book_json(book_file)
+        reference_data = load_book_json(reference_file)
+
+        with timers["verify_book_structure"]:
+            verify_book_structure(book_data, book_name)
+
+        verses = [(chapter["chapter"], verse) for chapter in book_data["chapters"] for verse in chapter["verses"]]
+        reference_verses = [verse for chapter in reference_data["chapters"] for verse in chapter["verses"]]
+        verses_total += len(verses)
+
+        with timers["check_encoding"]:
+            for _, verse in verses:
+                verifier.check_encoding(verse["text"])
+
+        with timers["check_punctuation"]:
+            for _, verse in verses:
+                verifier.check_punctuation(verse["text"])
+
+        with timers["compare_verses"]:
+            for (chapter, verse), reference_verse in zip(verses, reference_verses):
+                verifier.compare_verses(verse, reference_verse, book_name, chapter, verse["verse"])
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            with timers["verify_bible_book"]:
+                verify_bible_book(book_file, reference_file)
+
+        # Gloss data as the tagger would get it from TAHOT/TAGNT: one entry
+        # per tagged word, in a different order from the English text
+        tagging_inputs = []
+        for (_, verse), reference_verse in zip(verses, reference_verses):
+            words = [(word.lower(), [number]) for word, number in TAG_PATTERN.findall(verse["text"])]
+            words.reverse()
+            tagging_inputs.append((reference_verse["text"], words))
+        with timers["add_strongs_to_verse"]:
+            for text, words in tagging_inputs:
+                add_strongs_to_verse(text, words)
+
+        if verbose:
+            print(f"  {book_name}: {len(verses):,} verses")
+
+    return {
+        "scale": scale,
+        "corpus": corpus,
+        "results": {name: _result(timer, verses_total) for name, timer in timers.items()},
+    }
+
+
+def compare_to_baseline(runs: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """Print per-stage ratios against a baseline file; returns regressions"""
+    regressions = []
+    baseline_runs = {run["scale"]: run for run in baseline.get("runs", [])}
+
+    for run in runs:
+        previous = baseline_runs.get(run["scale"])
+        if not previous:
+            print(f"  {run['scale']}x: not in baseline")
+            continue
+        for name, result in run["results"].items():
+            old = previous["results"].get(name)
+            if not old or not old["seconds"]:
+                continue
+            ratio = result["seconds"] / old["seconds"]
+            marker = ""
+            if ratio > 1 + tolerance:
+                marker = "  ⚠ regression"
+                regressions.append(f"{run['scale']}x {name}: {ratio:.2f}x slower")
+            print(f"  {run['scale']:>3}x {name:24} {old['seconds']:9.3f}s → {result['seconds']:9.3f}s  ({ratio:.2f}x){marker}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data pipeline scripts on synthetic corpora")
+    parser.add_argument("--scales", default="1", help="Comma-separated corpus sizes relative to the KJV, 1 to 100 (default: 1)")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results file")
+    parser.add_argument("--work-dir", default=".cache/benchmark", help="Directory for the generated corpora")
+    parser.add_argument("--seed", type=int, default=1611, help="Random seed for the synthetic corpora")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Slowdown allowed before a stage counts as a regression (default: 0.2)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated corpora")
+    parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    try:
+        scales = [int(value) for value in args.scales.split(",")]
+    except ValueError:
+        print(f"Error: invalid --scales value: {args.scales}")
+        sys.exit(1)
+    if any(not 1 <= scale <= 100 for scale in scales):
+        print("Error: scales must be between 1 and 100")
+        sys.exit(1)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "runs": [],
+    }
+
+    for scale in scales:
+        print(f"=== {scale}x corpus ===")
+        work_dir = Path(args.work_dir) / f"{scale}x"
+        shutil.rmtree(work_dir, ignore_errors=True)
+        try:
+            run = run_scale(work_dir, scale, args.seed, verbose=args.verbose)
+        finally:
+            if not args.keep:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        results["runs"].append(run)
+        print(f"{run['corpus']['verses']:,} verses, {run['corpus']['bytes'] / 1e6:.1f} MB of chapter files")
+        for name, result in run["results"].items():
+            print(f"  {name:24} {result['seconds']:9.3f}s  {result['items_per_second'] or 0:12,.0f} verses/s")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n=== Compared with {args.baseline} ===")
+        regressions = compare_to_baseline(results["runs"], baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠ {len(regressions)} regression(s)")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Compact Memory-Mapped Binary Bible Corpus
+
+Converts the book-level JSON files in public/data into a single columnar
+binary file, and reads it back through mmap with zero-copy random access by
+book, chapter and verse. Whole-Bible jobs no longer need to reparse ~25 MB of
+indented JSON; opening the corpus only maps the file.
+
+File layout (all integers little-endian):
+
+    header        magic "GWBC", version, section counts and byte offsets
+    book table    per book:    name offset, name length, first chapter, chapter count   (4 x u32)
+    chapter table per chapter: chapter number, first verse, verse count                 (3 x u32)
+    verse numbers per verse:   verse number                                             (u32)
+    text offsets  per verse + 1: byte offset into the text blob                         (u64)
+    tag offsets   per verse + 1: index into the Strong's array                          (u32)
+    strongs       packed Strong's numbers, in verse order                               (u32)
+    names blob    UTF-8 book names
+    text blob     UTF-8 verse text exactly as in the JSON (tags and <em> included)
+
+A Strong's number is packed as bit 31 = Greek, bits 24-30 = suffix letter
+(0 = none, 1 = 'A', ...), bits 0-23 = the number, so [G2316] and [H1121A]
+each fit in one u32.
+
+Usage:
+    python3 scripts/binary_corpus.py build --data public/data --output bible_corpus.bin
+    python3 scripts/binary_corpus.py lookup bible_corpus.bin Genesis 1 1
+"""
+
+import argparse
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS
+from book_stream import BookStreamError, iter_chapters
+
+MAGIC = b"GWBC"
+FORMAT_VERSION = 1
+
+# magic, version, books, chapters, verses, strongs, then 8 section offsets
+HEADER = struct.Struct("<4sIIIII8Q")
+
+STRONGS_TAG = re.compile(r'\[([HG])(\d+)([A-Z]?)\]')
+
+GREEK_FLAG = 1 << 31
+SUFFIX_SHIFT = 24
+NUMBER_MASK = (1 << SUFFIX_SHIFT) - 1
+
+
+def pack_strongs(prefix: str, number: str, suffix: str = "") -> int:
+    """Pack one Strong's reference into a u32"""
+    value = int(number)
+    if value > NUMBER_MASK:
+        raise ValueError(f"Strong's number out of range: {prefix}{number}{suffix}")
+    if prefix == "G":
+        value |= GREEK_FLAG
+    if suffix:
+        value |= (ord(suffix) - ord("A") + 1) << SUFFIX_SHIFT
+    return value
+
+
+def unpack_strongs(value: int) -> str:
+    """Turn a packed u32 back into its reference, e.g. 'H430' or 'H1121A'"""
+    prefix = "G" if value & GREEK_FLAG else "H"
+    suffix = (value >> SUFFIX_SHIFT) & 0x7F
+    letter = chr(ord("A") + suffix - 1) if suffix else ""
+    return f"{prefix}{value & NUMBER_MASK}{letter}"
+
+
+def _to_u32(label, what: str) -> int:
+    """Chapter and verse labels are stored as integers"""
+    try:
+        return int(label)
+    except (TypeError, ValueError):
+        raise ValueError(f"Non-numeric {what} label: {label!r}")
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_corpus(data_dir: Path, output_file: Path, books: List[str] = None, verbose=False) -> dict:
+    """
+    Build a binary corpus from book-level JSON files.
+
+    Books are written in canonical KJV order; missing files are skipped.
+    The output is written to a temporary file and renamed into place.
+    """
+    books = books or list(KJV_CHAPTER_COUNTS.keys())
+
+    book_table = array("I")
+    chapter_table = array("I")
+    verse_numbers = array("I")
+    text_offsets = array("Q", [0])
+    tag_offsets = array("I", [0])
+    strongs = array("I")
+    names_blob = bytearray()
+    text_blob = bytearray()
+
+    for book_name in books:
+        book_file = data_dir / f"{book_name}.json"
+        if not book_file.exists():
+            if verbose:
+                print(f"⚠ {book_name}: File not found")
+            continue
+
+        name = book_name.encode("utf-8")
+        first_chapter = len(chapter_table) // 3
+        book_table.extend([len(names_blob), len(name), first_chapter, 0])
+        names_blob += name
+
+        for chapter_num, verses in iter_chapters(book_file):
+            chapter_table.extend([_to_u32(chapter_num, "chapter"), len(verse_numbers), len(verses)])
+            for verse in verses:
+                text = verse.get("text", "")
+                verse_numbers.append(_to_u32(verse.get("verse"), "verse"))
+                text_blob += text.encode("utf-8")
+                text_offsets.append(len(text_blob))
+                strongs.extend(pack_strongs(*tag) for tag in STRONGS_TAG.findall(text))
+                tag_offsets.append(len(strongs))
+
+        book_table[-1] = len(chapter_table) // 3 - first_chapter
+        if verbose:
+            print(f"✓ {book_name}: {book_table[-1]} chapters")
+
+    sections = [
+        _little_endian(book_table),
+        _little_endian(chapter_table),
+        _little_endian(verse_numbers),
+        _little_endian(text_offsets),
+        _little_endian(tag_offsets),
+        _little_endian(strongs),
+        bytes(names_blob),
+        bytes(text_blob),
+    ]
+
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        # Keep every section 8-byte aligned so the reader can cast in place
+        position += -position % 8
+        offsets.append(position)
+        position += len(section)
+
+    counts = {
+        "books": len(book_table) // 4,
+        "chapters": len(chapter_table) // 3,
+        "verses": len(verse_numbers),
+        "strongs": len(strongs),
+    }
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, counts["books"], counts["chapters"],
+                            counts["verses"], counts["strongs"], *offsets))
+        for offset, section in zip(offsets, sections):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(section)
+    os.replace(tmp_file, output_file)
+
+    counts["bytes"] = position
+    return counts
+
+
+class BinaryCorpus:
+    """
+    Read-only, memory-mapped view of a corpus built by build_corpus.
+
+    text_bytes() and strongs_packed() return zero-copy memoryviews into the
+    mapping. Callers must release them (or drop every reference) before
+    close(); while any is still alive, close() raises BufferError and the
+    corpus stays open and usable.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._open()
+        except BaseException:
+            self._release()
+            raise
+
+    def _open(self):
+        """Map the file and check its header and section bounds"""
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError(f"{self.path}: not a binary corpus file (only {size} bytes)")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        (magic, version, n_books, n_chapters, n_verses, n_strongs,
+         *offsets) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a binary corpus file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported corpus version {version}")
+
+        section_bytes = (n_books * 16, n_chapters * 12, n_verses * 4, (n_verses + 1) * 8,
+                         (n_verses + 1) * 4, n_strongs * 4, 0, 0)
+        if any(offset + length > size for offset, length in zip(offsets, section_bytes)):
+            raise ValueError(f"{self.path}: corpus file is truncated")
+
+        self._counts = (n_books, n_chapters, n_verses, n_strongs)
+        self._offsets = offsets
+        self._map_sections()
+        if offsets[7] + self._text_offsets[n_verses] > size:
+            raise ValueError(f"{self.path}: corpus file is truncated")
+
+        names_at = offsets[6]
+        self.books = []
+        self._book_index = {}
+        for i in range(n_books):
+            name_offset, name_length = self._book_table[i * 4], self._book_table[i * 4 + 1]
+            name = bytes(self._view[names_at + name_offset:names_at + name_offset + name_length])
+            try:
+                name = name.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError(f"{self.path}: corrupt book name table") from None
+            self.books.append(name)
+            self._book_index[name] = i
+
+    def _map_sections(self):
+        """Create the typed section views over self._view"""
+        n_books, n_chapters, n_verses, n_strongs = self._counts
+        (books_at, chapters_at, verse_numbers_at, text_offsets_at,
+         tag_offsets_at, strongs_at, names_at, text_at) = self._offsets
+
+        self._book_table = self._array(books_at, n_books * 4, "I")
+        self._chapter_table = self._array(chapters_at, n_chapters * 3, "I")
+        self._verse_numbers = self._array(verse_numbers_at, n_verses, "I")
+        self._text_offsets = self._array(text_offsets_at, n_verses + 1, "Q")
+        self._tag_offsets = self._array(tag_offsets_at, n_verses + 1, "I")
+        self._strongs = self._array(strongs_at, n_strongs, "I")
+        self._text = self._view[text_at:]
+
+    def _array(self, offset: int, count: int, typecode: str):
+        """Zero-copy typed view of a section (copied only on big-endian hosts)"""
+        size = array(typecode).itemsize
+        raw = self._view[offset:offset + count * size]
+        if sys.byteorder == "little":
+            return raw.cast(typecode)
+        values = array(typecode, raw.tobytes())
+        values.byteswap()
+        return values
+
+    def close(self):
+        """
+        Release the mapping and close the file.
+
+        Raises BufferError, leaving the corpus open, if a view returned by
+        text_bytes() or strongs_packed() is still alive.
+        """
+        if self._mmap.closed:
+            return
+        self._release_views()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Restore our own views so the corpus is still fully usable
+            self._view = memoryview(self._mmap)
+            self._map_sections()
+            raise BufferError(f"{self.path}: release the views returned by text_bytes() "
+                              "and strongs_packed() before closing the corpus") from None
+        self._file.close()
+
+    def _release_views(self):
+        for name in ("_book_table", "_chapter_table", "_verse_numbers",
+                     "_text_offsets", "_tag_offsets", "_strongs", "_text", "_view"):
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+
+    def _release(self):
+        """Undo a partly finished __init__; no views have been handed out yet"""
+        self._release_views()
+        if hasattr(self, "_mmap"):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._verse_numbers)
+
+    def _chapter_span(self, book: str, chapter: int) -> Tuple[int, int]:
+        """Return the (first verse, verse count) of a chapter"""
+        if book not in self._book_index:
+            raise KeyError(f"Unknown book: {book}")
+        b = self._book_index[book] * 4
+        first_chapter, chapter_count = self._book_table[b + 2], self._book_table[b + 3]
+        for c in range(first_chapter, first_chapter + chapter_count):
+            if self._chapter_table[c * 3] == chapter:
+                return self._chapter_table[c * 3 + 1], self._chapter_table[c * 3 + 2]
+        raise KeyError(f"Unknown chapter: {book} {chapter}")
+
+    def verse_index(self, book: str, chapter: int, verse: int) -> int:
+        """Global index of the first verse with this reference"""
+        first_verse, verse_count = self._chapter_span(book, int(chapter))
+        verse = int(verse)
+        # Verse numbers normally match their position, so try that first
+        guess = first_verse + verse - 1
+        if first_verse <= guess < first_verse + verse_count and self._verse_numbers[guess] == verse:
+            return guess
+        for i in range(first_verse, first_verse + verse_count):
+            if self._verse_numbers[i] == verse:
+                return i
+        raise KeyError(f"Unknown verse: {book} {chapter}:{verse}")
+
+    def text_bytes(self, index: int) -> memoryview:
+        """UTF-8 bytes of a verse as a zero-copy view into the mapping"""
+        return self._text[self._text_offsets[index]:self._text_offsets[index + 1]]
+
+    def text(self, index: int) -> str:
+        return str(self.text_bytes(index), "utf-8")
+
+    def strongs_packed(self, index: int) -> memoryview:
+        """Packed Strong's numbers of a verse as a zero-copy u32 view"""
+        return self._strongs[self._tag_offsets[index]:self._tag_offsets[index + 1]]
+
+    def strongs(self, index: int) -> List[str]:
+        return [unpack_strongs(value) for value in self.strongs_packed(index)]
+
+    def get_verse(self, book: str, chapter: int, verse: int) -> str:
+        """Verse text by reference, e.g. get_verse("Genesis", 1, 1)"""
+        return self.text(self.verse_index(book, chapter, verse))
+
+    def iter_verses(self, book: str = None) -> Iterator[Tuple[str, int, int, int]]:
+        """Yield (book, chapter, verse, index) in corpus order"""
+        books = [book] if book else self.books
+        for name in books:
+            b = self._book_index[name] * 4
+            first_chapter, chapter_count = self._book_table[b + 2], self._book_table[b + 3]
+            for c in range(first_chapter, first_chapter + chapter_count):
+                chapter, first_verse, verse_count = self._chapter_table[c * 3:c * 3 + 3]
+                for i in range(first_verse, first_verse + verse_count):
+                    yield name, chapter, self._verse_numbers[i], i
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query a binary Bible corpus")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Convert book JSON files into a binary corpus")
+    build_parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    build_parser.add_argument("--output", default="bible_corpus.bin", help="Output corpus file")
+    build_parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    lookup_parser = subparsers.add_parser("lookup", help="Print one verse from a corpus")
+    lookup_parser.add_argument("corpus", help="Corpus file")
+    lookup_parser.add_argument("book", help="Book name, e.g. Genesis")
+    lookup_parser.add_argument("chapter", type=int)
+    lookup_parser.add_argument("verse", type=int)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            counts = build_corpus(Path(args.data), Path(args.output), verbose=args.verbose)
+        except (BookStreamError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Books: {counts['books']}")
+        print(f"Chapters: {counts['chapters']}")
+        print(f"Verses: {counts['verses']}")
+        print(f"Strong's references: {counts['strongs']}")
+        print(f"Corpus saved to: {args.output} ({counts['bytes']:,} bytes)")
+        return
+
+    try:
+        with BinaryCorpus(args.corpus) as corpus:
+            index = corpus.verse_index(args.book, args.chapter, args.verse)
+            print(f"{args.book} {args.chapter}:{args.verse}")
+            print(corpus.text(index))
+            strongs = corpus.strongs(index)
+            if strongs:
+                print(f"Strong's: {', '.join(strongs)}")
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
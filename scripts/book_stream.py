@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for book-level Bible JSON files
+
+Book files look like:
+
+    {"book": "Genesis", "chapters": [{"chapter": "1", "verses": [...]}, ...]}
+
+json.load builds the whole tree before any check can run, and the larger
+files (1Samuel.json, 1Chronicles.json) are several MB. This module walks the
+file in fixed-size chunks and decodes one verse object at a time, so memory
+stays bounded by the chunk size plus the largest chapter, and callers can
+start checking verses before the file has been fully read.
+
+Usage:
+    from book_stream import iter_verses, iter_chapters
+
+    for chapter, verse, text in iter_verses("public/data/1Samuel.json"):
+        ...
+"""
+
+import json
+import re
+from typing import Any, Iterator, List, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class BookStreamError(ValueError):
+    """Raised when a book file cannot be read or is not valid JSON"""
+
+    def __init__(self, filepath, message):
+        super().__init__(f"{filepath}: {message}")
+        self.filepath = str(filepath)
+
+
+class _ChunkReader:
+    """Pull-based JSON tokenizer over a text file read in chunks"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # characters discarded from the front of buf
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping consumed text"""
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.offset += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def _error(self, message: str):
+        raise ValueError(f"{message} at char {self.offset + self.pos}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """Consume a structural character"""
+        if self.peek() != char:
+            self._error(f"Expected '{char}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                self._error(e.msg)
+            # A number or literal at the very end of the buffer may continue
+            # in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def members(self) -> Iterator[str]:
+        """Yield object keys after '{'; the caller consumes each value"""
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                self._error("Expected object key")
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                self._error("Expected ',' or '}'")
+
+    def elements(self) -> Iterator[None]:
+        """Yield once per array element after '['; the caller consumes it"""
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self._error("Expected ',' or ']'")
+
+
+def _iter_chapter(reader: _ChunkReader) -> Iterator[Tuple[str, Any, Any]]:
+    """Parse one chapter object, yielding verse events then a chapter event"""
+    reader.expect("{")
+    chapter_num = None
+    pending = []  # verses seen before the "chapter" key, rare
+    verse_count = 0
+
+    for key in reader.members():
+        if key == "chapter":
+            chapter_num = reader.value()
+            for verse in pending:
+                yield ("verse", chapter_num, verse)
+            pending = []
+        elif key == "verses" and reader.peek() == "[":
+            reader.expect("[")
+            for _ in reader.elements():
+                verse = reader.value()
+                if not isinstance(verse, dict):
+                    reader._error("Expected verse object")
+                verse_count += 1
+                if chapter_num is None:
+                    pending.append(verse)
+                else:
+                    yield ("verse", chapter_num, verse)
+        else:
+            reader.value()
+
+    if chapter_num is None:
+        chapter_num = "?"
+        for verse in pending:
+            yield ("verse", chapter_num, verse)
+
+    yield ("chapter", chapter_num, verse_count)
+
+
+def iter_book_events(filepath, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any, Any]]:
+    """
+    Stream a book file as parse events.
+
+    Yields:
+        ("book", name, None)              for the top-level "book" key
+        ("verse", chapter_num, verse)     for every verse object, in file order
+        ("chapter", chapter_num, count)   after each chapter's last verse
+
+    Chapters without a "chapter" key are reported as "?". Raises
+    BookStreamError if the file cannot be read or is not valid JSON.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            reader = _ChunkReader(f, chunk_size)
+            reader.expect("{")
+            for key in reader.members():
+                if key == "chapters" and reader.peek() == "[":
+                    reader.expect("[")
+                    for _ in reader.elements():
+                        yield from _iter_chapter(reader)
+                elif key == "book":
+                    yield ("book", reader.value(), None)
+                else:
+                    reader.value()
+            if reader.peek() != "":
+                reader._error("Extra data")
+    except (OSError, ValueError) as e:
+        raise BookStreamError(filepath, e) from e
+
+
+def iter_verses(filepath, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[Any, Any, str]]:
+    """Yield (chapter, verse, text) for every verse while the file is parsed"""
+    for kind, chapter_num, verse in iter_book_events(filepath, chunk_size):
+        if kind == "verse":
+            yield chapter_num, verse.get("verse", "?"), verse.get("text", "")
+
+
+def iter_chapters(filepath, chunk_size: int = DEFAULT_CHUNK_SIZE, meta: dict = None) -> Iterator[Tuple[Any, List[dict]]]:
+    """
+    Yield (chapter, verses) one chapter at a time.
+
+    If `meta` is given, the top-level "book" name is stored in it under
+    "book" as soon as it has been read.
+    """
+    verses = []
+    for kind, chapter_num, payload in iter_book_events(filepath, chunk_size):
+        if kind == "verse":
+            verses.append(payload)
+        elif kind == "chapter":
+            yield chapter_num, verses
+            verses = []
+        elif kind == "book" and meta is not None:
+            meta["book"] = chapter_num
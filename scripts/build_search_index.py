@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Full-Text Verse Search Index
+
+Builds a positional inverted index over the normalized verse text (Strong's
+tags and <em> markup removed, as in normalize_text) and writes it as small
+prefix-sharded static files. /api/search runs on the edge runtime and cannot
+scan the book files per request; with this index it only fetches the shard
+for each query term's two-letter prefix.
+
+Output layout (default: public/data/search-index):
+
+    index.json     format version, book order, shard list, document count
+    terms/an.json  postings for every term starting with "an"
+    terms/lo.json  ...
+
+A shard maps each term to its postings, varint-encoded then base64'd:
+
+    document count, then per document:
+        verse id gap, term frequency, position gap * frequency
+
+Verse ids use the same scheme as build_strongs_index.py
+(book_index * 1000000 + chapter * 1000 + verse); ids are delta-encoded
+within each term, and positions (token offsets in the normalized verse) are
+delta-encoded within each document. Books are read through
+iter_compacted_chapters; if a reference is still repeated, only its first
+copy is indexed.
+
+Usage:
+    python3 scripts/build_search_index.py build --data public/data --output public/data/search-index
+    python3 scripts/build_search_index.py search 'faith hope' '"in the beginning"'
+    python3 scripts/build_search_index.py bench
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS, iter_compacted_chapters
+from book_stream import BookStreamError
+from build_strongs_index import split_verse_id, verse_id
+from verify_bible_book import normalize_text
+
+INDEX_VERSION = 1
+PREFIX_LENGTH = 2
+
+TOKEN_PATTERN = re.compile(r"\w+(?:['’]\w+)*")
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# Phrase and AND queries timed by the bench command
+BENCHMARK_QUERIES = [
+    '"in the beginning"',
+    '"the son of man"',
+    '"and the lord spake unto moses"',
+    '"verily verily i say unto you"',
+    'faith hope charity',
+    'lord shepherd',
+    'david goliath',
+    'love neighbour',
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of normalized verse text"""
+    return TOKEN_PATTERN.findall(normalize_text(text).lower())
+
+
+def term_shard(term: str) -> str:
+    return term[:PREFIX_LENGTH]
+
+
+def encode_varints(values: List[int]) -> bytes:
+    out = bytearray()
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_varints(data: bytes) -> Iterator[int]:
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = 0
+            shift = 0
+
+
+def encode_postings(postings: List[Tuple[int, List[int]]]) -> str:
+    """[(verse id, positions), ...] sorted by id -> base64 varint string"""
+    values = [len(postings)]
+    previous_id = 0
+    for doc_id, positions in postings:
+        values.append(doc_id - previous_id)
+        values.append(len(positions))
+        previous_position = 0
+        for position in positions:
+            values.append(position - previous_position)
+            previous_position = position
+        previous_id = doc_id
+    return base64.b64encode(encode_varints(values)).decode('ascii')
+
+
+def decode_postings(encoded: str) -> List[Tuple[int, List[int]]]:
+    values = decode_varints(base64.b64decode(encoded))
+    postings = []
+    doc_id = 0
+    for _ in range(next(values)):
+        doc_id += next(values)
+        positions = []
+        position = 0
+        for _ in range(next(values)):
+            position += next(values)
+            positions.append(position)
+        postings.append((doc_id, positions))
+    return postings
+
+
+def build_index(data_dir: Path, output_dir: Path, verbose=False) -> Dict:
+    """Tokenize every verse once and write the sharded index"""
+    books = [name for name in KJV_CHAPTER_COUNTS if (data_dir / f"{name}.json").exists()]
+    index = defaultdict(dict)  # term -> {verse id: [positions]}
+    seen = set()
+    tokens_total = 0
+
+    for book_index, book_name in enumerate(books):
+        if verbose:
+            print(f"  Indexing {book_name}...")
+        for chapter_num, verses in iter_compacted_chapters(data_dir / f"{book_name}.json", book_name):
+            for verse in verses:
+                try:
+                    doc_id = verse_id(book_index, int(chapter_num), int(verse.get("verse")))
+                except (TypeError, ValueError):
+                    continue
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+
+                for position, term in enumerate(tokenize(verse.get("text", ""))):
+                    index[term].setdefault(doc_id, []).append(position)
+                    tokens_total += 1
+
+    shards = defaultdict(dict)
+    for term in sorted(index):
+        docs = index[term]
+        shards[term_shard(term)][term] = encode_postings(sorted(docs.items()))
+
+    terms_dir = output_dir / "terms"
+    terms_dir.mkdir(parents=True, exist_ok=True)
+    for stale in terms_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+
+    bytes_written = 0
+    for name, terms in shards.items():
+        bytes_written += _write_json(terms_dir / f"{name}.json", terms)
+
+    manifest = {
+        "version": INDEX_VERSION,
+        "prefix_length": PREFIX_LENGTH,
+        "verse_id": "book_index * 1000000 + chapter * 1000 + verse",
+        "books": books,
+        "documents": len(seen),
+        "shards": sorted(shards),
+    }
+    bytes_written += _write_json(output_dir / "index.json", manifest)
+
+    return {
+        "books": len(books),
+        "documents": len(seen),
+        "tokens": tokens_total,
+        "terms": len(index),
+        "shards": len(shards),
+        "bytes": bytes_written,
+    }
+
+
+def _write_json(path: Path, data) -> int:
+    content = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+    return len(content.encode('utf-8'))
+
+
+class SearchIndex:
+    """Query engine over a built index; shards are loaded lazily and cached"""
+
+    def __init__(self, index_dir):
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / "index.json", 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") != INDEX_VERSION:
+            raise ValueError(f"{self.index_dir}: unsupported search index version")
+        self.books = manifest["books"]
+        self.prefix_length = manifest["prefix_length"]
+        self._shards = {}
+        self._postings = {}
+
+    def postings(self, term: str) -> Dict[int, List[int]]:
+        """{verse id: positions} for a term, decoded once and cached"""
+        if term not in self._postings:
+            shard = term[:self.prefix_length]
+            if shard not in self._shards:
+                try:
+                    with open(self.index_dir / "terms" / f"{shard}.json", 'r', encoding='utf-8') as f:
+                        self._shards[shard] = json.load(f)
+                except FileNotFoundError:
+                    self._shards[shard] = {}
+            encoded = self._shards[shard].get(term)
+            self._postings[term] = dict(decode_postings(encoded)) if encoded else {}
+        return self._postings[term]
+
+    def phrase(self, terms: List[str]) -> List[int]:
+        """Verse ids containing the terms consecutively"""
+        if not terms:
+            return []
+        lists = [self.postings(term) for term in terms]
+        # Start from the rarest term's documents
+        candidates = set(min(lists, key=len))
+        for postings in lists:
+            candidates.intersection_update(postings)
+            if not candidates:
+                return []
+        if len(terms) == 1:
+            return sorted(candidates)
+
+        matches = []
+        for doc_id in sorted(candidates):
+            starts = set(lists[0][doc_id])
+            for offset, postings in enumerate(lists[1:], 1):
+                starts.intersection_update(position - offset for position in postings[doc_id])
+                if not starts:
+                    break
+            if starts:
+                matches.append(doc_id)
+        return matches
+
+    def search(self, query: str) -> List[int]:
+        """
+        Verse ids matching every part of the query (AND).
+
+        Double-quoted parts are phrases; other words are single terms. Each
+        part is tokenized like the indexed text, so Strong's tags and <em>
+        markup pasted from a verse are ignored.
+        """
+        parts = []
+        for quoted, word in QUERY_PATTERN.findall(query):
+            terms = tokenize(quoted or word)
+            if quoted:
+                if terms:
+                    parts.append(terms)
+            else:
+                parts.extend([term] for term in terms)
+        if not parts:
+            return []
+
+        # Evaluate the cheapest parts first and stop as soon as nothing is left
+        result = None
+        for terms in sorted(parts, key=lambda t: min(len(self.postings(term)) for term in t)):
+            ids = set(self.phrase(terms))
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return sorted(result)
+
+    def reference(self, doc_id: int) -> str:
+        book_index, chapter, verse = split_verse_id(doc_id)
+        return f"{self.books[book_index]} {chapter}:{verse}"
+
+
+def run_benchmark(index_dir: str, queries: List[str], repeat: int) -> List[Dict]:
+    """Time each query cold (fresh engine, shards read from disk) and warm"""
+    results = []
+    for query in queries:
+        engine = SearchIndex(index_dir)
+        start = time.perf_counter()
+        hits = engine.search(query)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            engine.search(query)
+        warm = (time.perf_counter() - start) / repeat
+
+        results.append({
+            "query": query,
+            "type": "phrase" if query.startswith('"') else "and",
+            "hits": len(hits),
+            "cold_ms": round(cold * 1000, 3),
+            "warm_ms": round(warm * 1000, 3),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build, query or benchmark the verse search index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Build the index from book JSON files")
+    build_parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    build_parser.add_argument("--output", default="public/data/search-index", help="Output directory")
+    build_parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    search_parser = subparsers.add_parser("search", help="Run queries against an index")
+    search_parser.add_argument("queries", nargs="+", help='Query, e.g. \'faith hope\' or \'"son of man"\'')
+    search_parser.add_argument("--index", default="public/data/search-index", help="Index directory")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum results to print per query")
+
+    bench_parser = subparsers.add_parser("bench", help="Time phrase and AND queries")
+    bench_parser.add_argument("--index", default="public/data/search-index", help="Index directory")
+    bench_parser.add_argument("--repeat", type=int, default=100, help="Warm runs per query")
+    bench_parser.add_argument("--output", help="Write results as JSON to this file")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            stats = build_index(Path(args.data), Path(args.output), verbose=args.verbose)
+        except BookStreamError as e:
+            print(f"Error loading {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Books indexed: {stats['books']}")
+        print(f"Verses indexed: {stats['documents']}")
+        print(f"Tokens: {stats['tokens']}")
+        print(f"Distinct terms: {stats['terms']}")
+        print(f"Shards: {stats['shards']} ({stats['bytes']:,} bytes)")
+        print(f"Index saved to: {args.output}")
+        return
+
+    try:
+        if args.command == "search":
+            engine = SearchIndex(args.index)
+            for query in args.queries:
+                hits = engine.search(query)
+                print(f"{query}: {len(hits)} verses")
+                for doc_id in hits[:args.limit]:
+                    print(f"  {engine.reference(doc_id)}")
+                if len(hits) > args.limit:
+                    print(f"  ... and {len(hits) - args.limit} more")
+            return
+
+        results = run_benchmark(args.index, BENCHMARK_QUERIES, args.repeat)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'Query':40} {'Type':6} {'Hits':>6} {'Cold ms':>9} {'Warm ms':>9}")
+    for result in results:
+        print(f"{result['query']:40} {result['type']:6} {result['hits']:6} "
+              f"{result['cold_ms']:9.3f} {result['warm_ms']:9.3f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Build Sharded Strong's Dictionary Files
+
+lib/strongs.ts downloads the whole Hebrew (2 MB) or Greek (1.2 MB)
+dictionary before StrongsTooltip can show one definition. This script
+derives smaller files from the canonical dictionaries
+(public/data/strongs-{hebrew,greek}-dictionary.json):
+
+    index.json          shard size, tooltip fields, entry counts
+    tooltip/H/4.json    lemma, translit and kjv_def for H400-H499
+    full/H/4.json       complete entries for H400-H499
+    tooltip-H.json      lemma, translit and kjv_def for every Hebrew number
+
+Shards use the same 100-number ranges as the Strong's verse index
+(build_strongs_index.py), so the first hover only fetches a few KB. Hebrew
+entries call the transliteration "xlit" and Greek ones "translit"; the
+tooltip files always use "translit".
+
+The .js twins of the dictionaries are not read; the build only reports
+whether they still hold the same data as the canonical JSON.
+
+Usage:
+    python3 scripts/build_strongs_dictionary.py
+    python3 scripts/build_strongs_dictionary.py --data public/data --output public/data/strongs-dictionary
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict
+
+from build_strongs_index import SHARD_SIZE, shard_name, write_if_changed
+
+DICTIONARY_VERSION = 1
+
+DICTIONARIES = {
+    "H": ("strongs-hebrew-dictionary", "strongsHebrewDictionary"),
+    "G": ("strongs-greek-dictionary", "strongsGreekDictionary"),
+}
+
+TOOLTIP_FIELDS = ["lemma", "translit", "kjv_def"]
+
+
+def tooltip_entry(entry: Dict) -> Dict:
+    """Project a dictionary entry onto the fields the tooltip shows"""
+    projected = {
+        "lemma": entry.get("lemma"),
+        "translit": entry.get("translit", entry.get("xlit")),
+        "kjv_def": entry.get("kjv_def"),
+    }
+    return {field: value.strip() for field, value in projected.items() if value}
+
+
+def js_twin_matches(js_file: Path, variable: str, dictionary: Dict) -> bool:
+    """Whether a `var name = {...}; module.exports = name;` file holds the same data"""
+    with open(js_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = text.index(f"var {variable} = ") + len(f"var {variable} = ")
+    end = text.rindex("module.exports")
+    return json.loads(text[start:end].rstrip().rstrip(';')) == dictionary
+
+
+def build_dictionary(data_dir: Path, output_dir: Path, verbose=False) -> Dict:
+    """Write tooltip and full shards for both languages; returns statistics"""
+    stats = {"entries": {}, "shards": 0, "files_written": 0, "js_twins": {}}
+    expected = set()
+
+    for prefix, (name, variable) in DICTIONARIES.items():
+        with open(data_dir / f"{name}.json", 'r', encoding='utf-8') as f:
+            dictionary = json.load(f)
+
+        numbers = sorted(dictionary, key=lambda n: int(n[1:]))
+        tooltip_shards = defaultdict(dict)
+        full_shards = defaultdict(dict)
+        for number in numbers:
+            shard = shard_name(number)
+            tooltip_shards[shard][number] = tooltip_entry(dictionary[number])
+            full_shards[shard][number] = dictionary[number]
+
+        outputs = {f"tooltip-{prefix}.json": {number: tooltip_entry(dictionary[number]) for number in numbers}}
+        for shard in tooltip_shards:
+            outputs[f"tooltip/{shard}"] = tooltip_shards[shard]
+            outputs[f"full/{shard}"] = full_shards[shard]
+
+        for relative_path, data in outputs.items():
+            expected.add(relative_path)
+            if write_if_changed(output_dir / relative_path, data):
+                stats["files_written"] += 1
+                if verbose:
+                    print(f"  wrote {relative_path}")
+
+        stats["entries"][prefix] = len(numbers)
+        stats["shards"] += len(tooltip_shards)
+
+        js_file = data_dir / f"{name}.js"
+        if js_file.exists():
+            stats["js_twins"][js_file.name] = js_twin_matches(js_file, variable, dictionary)
+
+    # Remove shards for ranges that no longer have entries
+    for stale in output_dir.glob("*/[HG]/*.json"):
+        if stale.relative_to(output_dir).as_posix() not in expected:
+            stale.unlink()
+            stats["files_written"] += 1
+
+    manifest = {
+        "version": DICTIONARY_VERSION,
+        "shard_size": SHARD_SIZE,
+        "tooltip_fields": TOOLTIP_FIELDS,
+        "entries": stats["entries"],
+    }
+    write_if_changed(output_dir / "index.json", manifest)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build tooltip and sharded Strong's dictionary files")
+    parser.add_argument("--data", default="public/data", help="Directory containing the canonical dictionary JSON files")
+    parser.add_argument("--output", default="public/data/strongs-dictionary", help="Output directory")
+    parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    try:
+        stats = build_dictionary(Path(args.data), Path(args.output), verbose=args.verbose)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for prefix, count in stats["entries"].items():
+        print(f"{prefix} entries: {count}")
+    print(f"Shards per format: {stats['shards']} ({stats['files_written']} files written)")
+    for name, matches in stats["js_twins"].items():
+        print(f"{name}: {'matches canonical JSON' if matches else 'DIFFERS from canonical JSON'}")
+    print(f"Dictionary files saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
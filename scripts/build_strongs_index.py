@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Build a Strong's Number Inverted Index
+
+Scans every book file once and records, for each Strong's number, the verses
+whose text carries its tag (e.g. [H430] or [G2316]). The result is written
+as small static shards so the /strongs page and StrongsModal can fetch the
+verses for one number without downloading every book.
+
+Output layout (default: public/data/strongs-index):
+
+    index.json      shard size and book order
+    H/0.json        postings for H0-H99
+    H/1.json        postings for H100-H199
+    ...
+    G/0.json        postings for G0-G99
+
+Each shard maps a number to a delta-encoded list of verse ids:
+
+    {"H430": [1001001, 1, 25, ...]}
+
+The first value is absolute and every following value is the gap to the
+previous id. A verse id is book_index * 1000000 + chapter * 1000 + verse,
+where book_index is the position in index.json's "books" list.
+
+Books are read through iter_compacted_chapters. Per-book postings are cached
+by file content hash, so a rebuild only rescans books that changed, and only
+shards whose content changed are rewritten.
+
+Usage:
+    python3 scripts/build_strongs_index.py
+    python3 scripts/build_strongs_index.py --data public/data --output public/data/strongs-index
+    python3 scripts/build_strongs_index.py --lookup H430
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS, VerificationCache, iter_compacted_chapters
+from book_stream import BookStreamError
+
+INDEX_VERSION = 2
+SHARD_SIZE = 100
+
+# Suffix letters and leading zeros are dropped to match the dictionary keys
+STRONGS_TAG = re.compile(r'\[([HG])(\d+)[A-Z]?\]')
+
+
+def verse_id(book_index: int, chapter: int, verse: int) -> int:
+    return book_index * 1000000 + chapter * 1000 + verse
+
+
+def split_verse_id(value: int) -> Tuple[int, int, int]:
+    """Inverse of verse_id: (book_index, chapter, verse)"""
+    return value // 1000000, value // 1000 % 1000, value % 1000
+
+
+def delta_encode(values: List[int]) -> List[int]:
+    return [value - previous for previous, value in zip([0] + values, values)]
+
+
+def delta_decode(gaps: List[int]) -> List[int]:
+    values = []
+    total = 0
+    for gap in gaps:
+        total += gap
+        values.append(total)
+    return values
+
+
+def write_if_changed(path: Path, data) -> bool:
+    """Write compact JSON atomically, skipping files whose content is identical"""
+    content = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+    return True
+
+
+def shard_name(number: str) -> str:
+    """Shard path for a number like 'H430' -> 'H/4.json'"""
+    return f"{number[0]}/{int(number[1:]) // SHARD_SIZE}.json"
+
+
+def scan_book(book_file: Path, book_name: str) -> Dict[str, List[int]]:
+    """
+    Return {number: [book-local verse ids]} for one compacted book (see
+    verse_id with book_index 0); each reference is listed once per number.
+    """
+    postings = defaultdict(set)
+    for chapter_num, verses in iter_compacted_chapters(book_file, book_name):
+        for verse in verses:
+            try:
+                local_id = verse_id(0, int(chapter_num), int(verse.get("verse")))
+            except (TypeError, ValueError):
+                continue
+            for prefix, digits in STRONGS_TAG.findall(verse.get("text", "")):
+                postings[f"{prefix}{int(digits)}"].add(local_id)
+    return {number: sorted(ids) for number, ids in postings.items()}
+
+
+class StrongsIndexBuilder:
+    """Builds the sharded index, reusing per-book postings from a cache"""
+
+    def __init__(self, data_dir: str, output_dir: str, cache_file: str = None, verbose=False):
+        self.data_dir = Path(data_dir)
+        self.output_dir = Path(output_dir)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.verbose = verbose
+        self.cache = {}
+
+        if self.cache_file:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("index_version") == INDEX_VERSION:
+                    self.cache = data.get("books", {})
+            except (OSError, ValueError):
+                pass
+
+    def log(self, message):
+        """Print message if verbose mode is enabled"""
+        if self.verbose:
+            print(message)
+
+    def book_postings(self, book_name: str) -> Dict[str, List[int]]:
+        """Postings for one book, from the cache when the file is unchanged"""
+        book_file = self.data_dir / f"{book_name}.json"
+        file_hash = VerificationCache.file_hash(book_file)
+
+        entry = self.cache.get(book_name)
+        if entry and entry.get("sha256") == file_hash:
+            self.log(f"  {book_name}: unchanged")
+            return entry["postings"]
+
+        self.log(f"  {book_name}: scanning")
+        postings = scan_book(book_file, book_name)
+        self.cache[book_name] = {"sha256": file_hash, "postings": postings}
+        self.rescanned += 1
+        return postings
+
+    def build(self) -> Dict:
+        """Build all shards and index.json; returns build statistics"""
+        books = [name for name in KJV_CHAPTER_COUNTS if (self.data_dir / f"{name}.json").exists()]
+        self.rescanned = 0
+
+        merged = defaultdict(set)
+        for book_index, book_name in enumerate(books):
+            base = verse_id(book_index, 0, 0)
+            for number, local_ids in self.book_postings(book_name).items():
+                merged[number].update(base + local_id for local_id in local_ids)
+
+        # Drop cache entries for books that no longer exist
+        self.cache = {name: entry for name, entry in self.cache.items() if name in books}
+
+        shards = defaultdict(dict)
+        postings_total = 0
+        for number in sorted(merged, key=lambda n: (n[0], int(n[1:]))):
+            ids = sorted(merged[number])
+            shards[shard_name(number)][number] = delta_encode(ids)
+            postings_total += len(ids)
+
+        written = 0
+        for name, postings in shards.items():
+            if write_if_changed(self.output_dir / name, postings):
+                written += 1
+
+        # Remove shards that no longer have any numbers
+        for stale in self.output_dir.glob("[HG]/*.json"):
+            if f"{stale.parent.name}/{stale.name}" not in shards:
+                stale.unlink()
+                written += 1
+
+        manifest = {
+            "version": INDEX_VERSION,
+            "shard_size": SHARD_SIZE,
+            "verse_id": "book_index * 1000000 + chapter * 1000 + verse",
+            "books": books,
+        }
+        write_if_changed(self.output_dir / "index.json", manifest)
+
+        if self.cache_file:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"index_version": INDEX_VERSION, "books": self.cache}, f, separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+
+        return {
+            "books": len(books),
+            "books_rescanned": self.rescanned,
+            "numbers": len(merged),
+            "postings": postings_total,
+            "shards": len(shards),
+            "shards_written": written,
+        }
+
+
+def lookup(index_dir: str, number: str) -> List[Tuple[str, int, int]]:
+    """Return [(book, chapter, verse), ...] for a number such as 'H430'"""
+    index_dir = Path(index_dir)
+    number = f"{number[0].upper()}{int(number[1:])}"
+    with open(index_dir / "index.json", 'r', encoding='utf-8') as f:
+        books = json.load(f)["books"]
+    try:
+        with open(index_dir / shard_name(number), 'r', encoding='utf-8') as f:
+            gaps = json.load(f).get(number, [])
+    except FileNotFoundError:
+        return []
+    references = []
+    for value in delta_decode(gaps):
+        book_index, chapter, verse = split_verse_id(value)
+        references.append((books[book_index], chapter, verse))
+    return references
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Strong's number inverted index")
+    parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    parser.add_argument("--output", default="public/data/strongs-index", help="Output directory for index shards")
+    parser.add_argument("--cache", default=".cache/strongs-index.json", help="Per-book postings cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every book")
+    parser.add_argument("--lookup", metavar="NUMBER", help="Print the verses for a number (e.g. H430) from an existing index")
+    parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if args.lookup:
+        try:
+            references = lookup(args.output, args.lookup)
+        except (OSError, ValueError, IndexError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{args.lookup}: {len(references)} verses")
+        for book, chapter, verse in references[:50]:
+            print(f"  {book} {chapter}:{verse}")
+        if len(references) > 50:
+            print(f"  ... and {len(references) - 50} more")
+        return
+
+    builder = StrongsIndexBuilder(args.data, args.output,
+                                  cache_file=None if args.no_cache else args.cache,
+                                  verbose=args.verbose)
+    try:
+        stats = builder.build()
+    except BookStreamError as e:
+        print(f"Error loading {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Books indexed: {stats['books']} ({stats['books_rescanned']} rescanned)")
+    print(f"Strong's numbers: {stats['numbers']}")
+    print(f"Verse postings: {stats['postings']}")
+    print(f"Shards: {stats['shards']} ({stats['shards_written']} written)")
+    print(f"Index saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
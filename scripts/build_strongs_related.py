@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Build the Strong's "Frequently Appears With" Index
+
+For every Strong's number, ranks the numbers that are tagged in the same
+verses, so StrongsModal can show related words next to the dictionary entry.
+
+Co-occurrence is counted per verse: two numbers co-occur once in a verse
+however often either is tagged there. Neighbors are ranked by normalized
+pointwise mutual information,
+
+    npmi(a, b) = log(p(a, b) / (p(a) p(b))) / -log(p(a, b))
+
+where p is the share of tagged verses containing the number(s). NPMI lies
+in [-1, 1] and, unlike raw PMI, does not favour pairs of very rare numbers;
+pairs seen in fewer than --min-count verses are ignored altogether.
+
+The verse x number incidence matrix and its transpose are kept in CSR
+layout in stdlib arrays, and the co-occurrence matrix is produced one row
+at a time (row a counts the numbers of every verse containing a), then
+reduced to its top K neighbors. Memory stays proportional to the number of
+tags, never to numbers squared (14,000 x 14,000 dense would be 196 million
+cells).
+
+Output layout (default: public/data/strongs-related), sharded like the
+Strong's verse index:
+
+    index.json      shard size, K, minimum count, scoring, verse count
+    H/4.json        neighbors of H400-H499: {"H430": [["H3068", 1234, 0.41], ...]}
+
+Each neighbor is [number, verses together, score], best first.
+
+Usage:
+    python3 scripts/build_strongs_related.py
+    python3 scripts/build_strongs_related.py --data public/data --top-k 10 --min-count 3
+    python3 scripts/build_strongs_related.py --lookup H430
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS, iter_compacted_chapters
+from book_stream import BookStreamError
+from build_strongs_index import SHARD_SIZE, STRONGS_TAG, shard_name, verse_id, write_if_changed
+
+RELATED_VERSION = 1
+DEFAULT_TOP_K = 10
+DEFAULT_MIN_COUNT = 3
+
+
+def number_key(number: str) -> Tuple[str, int]:
+    return number[0], int(number[1:])
+
+
+def build_incidence(data_dir: Path, verbose=False) -> Tuple[List[str], array, array]:
+    """
+    Scan every book once into a verse x number incidence matrix.
+
+    Returns (number labels, indptr, indices): verse i holds the distinct
+    number columns indices[indptr[i]:indptr[i + 1]]. Only verses with at
+    least one tag are kept, and each reference is counted once.
+    """
+    books = [name for name in KJV_CHAPTER_COUNTS if (data_dir / f"{name}.json").exists()]
+    columns = {}
+    labels = []
+    indptr = array('I', [0])
+    indices = array('I')
+    seen = set()
+
+    for book_index, book_name in enumerate(books):
+        if verbose:
+            print(f"  Scanning {book_name}...")
+        for chapter_num, verses in iter_compacted_chapters(data_dir / f"{book_name}.json", book_name):
+            for verse in verses:
+                try:
+                    doc_id = verse_id(book_index, int(chapter_num), int(verse.get("verse")))
+                except (TypeError, ValueError):
+                    continue
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+
+                numbers = {f"{prefix}{int(digits)}" for prefix, digits in STRONGS_TAG.findall(verse.get("text", ""))}
+                if not numbers:
+                    continue
+                for number in numbers:
+                    column = columns.get(number)
+                    if column is None:
+                        column = columns[number] = len(labels)
+                        labels.append(number)
+                    indices.append(column)
+                indptr.append(len(indices))
+
+    return labels, indptr, indices
+
+
+def transpose(indptr: array, indices: array, columns: int) -> Tuple[array, array]:
+    """CSR transpose of a 0/1 matrix: (indptr, indices) listing the rows of each column"""
+    counts = array('I', bytes(4 * (columns + 1)))
+    for column in indices:
+        counts[column + 1] += 1
+    for column in range(columns):
+        counts[column + 1] += counts[column]
+
+    rows = array('I', bytes(4 * len(indices)))
+    fill = array('I', counts[:-1])
+    for row in range(len(indptr) - 1):
+        for column in indices[indptr[row]:indptr[row + 1]]:
+            rows[fill[column]] = row
+            fill[column] += 1
+    return counts, rows
+
+
+def build_related(data_dir: Path, top_k: int = DEFAULT_TOP_K, min_count: int = DEFAULT_MIN_COUNT,
+                  verbose=False) -> Tuple[Dict[str, List], Dict]:
+    """Compute the top-K neighbors of every number; returns (neighbors, statistics)"""
+    labels, verse_ptr, verse_numbers = build_incidence(data_dir, verbose=verbose)
+    verses = len(verse_ptr) - 1
+    number_ptr, number_verses = transpose(verse_ptr, verse_numbers, len(labels))
+    frequency = [number_ptr[a + 1] - number_ptr[a] for a in range(len(labels))]
+    log_verses = math.log(verses) if verses else 0.0
+
+    neighbors = {}
+    pairs = 0
+    for a, number in enumerate(labels):
+        # Row a of the co-occurrence matrix: numbers in the verses containing a
+        row = Counter()
+        for v in number_verses[number_ptr[a]:number_ptr[a + 1]]:
+            row.update(verse_numbers[verse_ptr[v]:verse_ptr[v + 1]])
+        del row[a]
+        pairs += len(row)
+
+        scored = []
+        for b, together in row.items():
+            if together < min_count:
+                continue
+            log_joint = math.log(together) - log_verses
+            if log_joint == 0:
+                score = 1.0  # Both numbers are tagged in every verse
+            else:
+                pmi = log_joint - (math.log(frequency[a]) - log_verses) - (math.log(frequency[b]) - log_verses)
+                score = pmi / -log_joint
+            scored.append((score, together, b))
+
+        if scored:
+            scored.sort(key=lambda entry: (-entry[0], -entry[1], number_key(labels[entry[2]])))
+            neighbors[number] = [[labels[b], together, round(score, 4)] for score, together, b in scored[:top_k]]
+
+    stats = {
+        "verses": verses,
+        "numbers": len(labels),
+        "tags": len(verse_numbers),
+        "pairs": pairs // 2,
+        "numbers_with_neighbors": len(neighbors),
+    }
+    return neighbors, stats
+
+
+def write_related(neighbors: Dict[str, List], output_dir: Path, stats: Dict, top_k: int, min_count: int) -> int:
+    """Write shards and index.json, removing stale shards; returns files written"""
+    shards = defaultdict(dict)
+    for number in sorted(neighbors, key=number_key):
+        shards[shard_name(number)][number] = neighbors[number]
+
+    written = 0
+    for name, entries in shards.items():
+        if write_if_changed(output_dir / name, entries):
+            written += 1
+
+    # Remove shards that no longer have any numbers
+    for stale in output_dir.glob("[HG]/*.json"):
+        if f"{stale.parent.name}/{stale.name}" not in shards:
+            stale.unlink()
+            written += 1
+
+    manifest = {
+        "version": RELATED_VERSION,
+        "shard_size": SHARD_SIZE,
+        "top_k": top_k,
+        "min_count": min_count,
+        "score": "npmi",
+        "neighbor": ["number", "verses together", "score"],
+        "verses": stats["verses"],
+    }
+    if write_if_changed(output_dir / "index.json", manifest):
+        written += 1
+    return written
+
+
+def lookup(index_dir: str, number: str) -> List:
+    """Return [[number, verses together, score], ...] for a number such as 'H430'"""
+    number = f"{number[0].upper()}{int(number[1:])}"
+    try:
+        with open(Path(index_dir) / shard_name(number), 'r', encoding='utf-8') as f:
+            return json.load(f).get(number, [])
+    except FileNotFoundError:
+        return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Strong's co-occurrence (related words) index")
+    parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    parser.add_argument("--output", default="public/data/strongs-related", help="Output directory for shards")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help=f"Neighbors kept per number (default: {DEFAULT_TOP_K})")
+    parser.add_argument("--min-count", type=int, default=DEFAULT_MIN_COUNT,
+                        help=f"Minimum verses a pair must share (default: {DEFAULT_MIN_COUNT})")
+    parser.add_argument("--lookup", metavar="NUMBER", help="Print the neighbors of a number (e.g. H430) from an existing index")
+    parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if args.lookup:
+        try:
+            related = lookup(args.output, args.lookup)
+        except (OSError, ValueError, IndexError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{args.lookup}: {len(related)} related numbers")
+        for number, together, score in related:
+            print(f"  {number:8} {together:6} verses  npmi {score:.3f}")
+        return
+
+    if args.top_k < 1 or args.min_count < 1:
+        print("Error: --top-k and --min-count must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        neighbors, stats = build_related(Path(args.data), args.top_k, args.min_count, verbose=args.verbose)
+    except BookStreamError as e:
+        print(f"Error loading {e}", file=sys.stderr)
+        sys.exit(1)
+    written = write_related(neighbors, Path(args.output), stats, args.top_k, args.min_count)
+    elapsed = time.perf_counter() - start
+
+    print(f"Tagged verses: {stats['verses']}")
+    print(f"Strong's numbers: {stats['numbers']} ({stats['numbers_with_neighbors']} with related numbers)")
+    print(f"Co-occurring pairs: {stats['pairs']} from {stats['tags']} verse tags")
+    print(f"Files written: {written} in {elapsed:.2f}s")
+    print(f"Related-words index saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,13 @@ Format verification report JSON into human-readable text
 Usage:
     python3 format_report.py report.json
     python3 format_report.py report.json --output report.txt
+    python3 format_report.py issues.ndjson      (any --issues-log file, whatever its name)
+    python3 format_report.py issues.ndjson --type punctuation --book Psalms
+    python3 format_report.py issues.ndjson --type comparison --min-difference 0.5 --page 2
 """
 
 import json
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -36,6 +40,10 @@ def format_report(report_data):
     lines.append(f"Encoding Issues:           {summary.get('encoding_issues_total', 0)}")
     lines.append(f"Punctuation Issues:        {summary.get('punctuation_issues_total', 0)}")
     
+    if 'duplicate_verses_total' in summary:
+        lines.append(f"Duplicate Verse Copies:    {summary.get('duplicate_verses_total', 0)}")
+        lines.append(f"Out-of-Order Verses:       {summary.get('out_of_order_verses_total', 0)}")
+    
     if 'comparison_differences' in summary:
         lines.append(f"Comparison Differences:    {summary.get('comparison_differences', 0)}")
     
@@ -69,6 +77,29 @@ def format_report(report_data):
         
         lines.append("")
     
+    # Web Output Section
+    web_output = report_data.get("web_output", {})
+    if web_output:
+        lines.append("WEB OUTPUT")
+        lines.append("-" * 70)
+        lines.append(f"  {'Book':20} {'Indented':>10} {'Minified':>10} {'Gzip':>9} {'Chapter gz':>11} {'Parse ms':>15}")
+        
+        for book, stats in web_output.items():
+            lines.append(
+                f"  {book:20} {stats.get('indented_bytes', 0):10,} {stats.get('minified_bytes', 0):10,} "
+                f"{stats.get('gzip_bytes', 0):9,} {stats.get('largest_chapter_gzip_bytes', 0):11,} "
+                f"{stats.get('indented_parse_ms', 0):7.2f}→{stats.get('minified_parse_ms', 0):.2f}"
+            )
+        
+        indented = sum(stats.get("indented_bytes", 0) for stats in web_output.values())
+        minified = sum(stats.get("minified_bytes", 0) for stats in web_output.values())
+        compressed = sum(stats.get("gzip_bytes", 0) for stats in web_output.values())
+        if indented:
+            lines.append(f"\nTotal: {indented:,} bytes indented → {minified:,} minified "
+                         f"({minified / indented:.0%}) → {compressed:,} gzip ({compressed / indented:.0%})")
+        lines.append("Chapter gz: largest per-chapter file, precompressed")
+        lines.append("")
+    
     # Verification Section
     verification = report_data.get("verification", {})
     if verification:
@@ -138,6 +169,44 @@ def format_report(report_data):
         lines.append(f"\nTotal punctuation issues: {total}")
         lines.append("")
     
+    # Duplicate and Out-of-Order Verses
+    duplicate_verses = report_data.get("duplicate_verses", {})
+    out_of_order_verses = report_data.get("out_of_order_verses", {})
+    if duplicate_verses or out_of_order_verses:
+        lines.append("VERSE SEQUENCE ISSUES")
+        lines.append("-" * 70)
+        
+        for book, entries in duplicate_verses.items():
+            lines.append(f"\n{book}: duplicated verse numbers")
+            for entry in entries[:5]:  # Show first 5
+                lines.append(f"  {entry.get('reference', '?')}: {entry.get('copies', 0)} copies")
+            if len(entries) > 5:
+                lines.append(f"  ... and {len(entries) - 5} more")
+        
+        for book, entries in out_of_order_verses.items():
+            lines.append(f"\n{book}: out-of-order verses")
+            for entry in entries[:5]:  # Show first 5
+                lines.append(f"  {entry.get('reference', '?')} follows verse {entry.get('follows', '?')}")
+            if len(entries) > 5:
+                lines.append(f"  ... and {len(entries) - 5} more")
+        
+        lines.append("")
+    
+    # Compaction Section
+    compaction = report_data.get("compaction", {})
+    if compaction:
+        lines.append("COMPACTION")
+        lines.append("-" * 70)
+        
+        for book, stats in compaction.items():
+            lines.append(f"  ✂ {book:20} {stats.get('verses_before', 0):6} → {stats.get('verses_after', 0):5} verses")
+            for reference in stats.get("unresolved", []):
+                lines.append(f"      {reference}: conflicting copies, kept the first")
+        
+        removed = sum(stats.get("removed", 0) for stats in compaction.values())
+        lines.append(f"\nTotal verses removed: {removed}")
+        lines.append("")
+    
     # Comparison Section
     comparison = report_data.get("comparison", {})
     if comparison:
@@ -180,6 +249,38 @@ def format_report(report_data):
         
         lines.append("")
     
+    # Performance Section
+    performance = report_data.get("performance", {})
+    if performance:
+        lines.append("PERFORMANCE")
+        lines.append("-" * 70)
+        lines.append(f"  {'Phase':20} {'Wall s':>9} {'CPU s':>9} {'Workers s':>9} {'Peak MB':>9}")
+        
+        # CPU s includes the worker share, which is also shown on its own
+        for phase, stats in performance.get("phases", {}).items():
+            lines.append(
+                f"  {phase:20} {stats.get('wall_seconds', 0):9.2f} {stats.get('cpu_seconds', 0):9.2f} "
+                f"{stats.get('child_cpu_seconds', 0):9.2f} {stats.get('peak_memory_bytes', 0) / 1e6:9.1f}"
+            )
+        
+        book_times = []
+        for book, phases in performance.get("books", {}).items():
+            wall = sum(stats.get("wall_seconds", 0) for stats in phases.values())
+            book_times.append((wall, book))
+        book_times.sort(reverse=True)
+        
+        if book_times:
+            lines.append("\nSlowest books:")
+            for wall, book in book_times[:10]:  # Top 10
+                lines.append(f"  {book:20} {wall:9.3f}s")
+        
+        for phase, counts in performance.get("counters", {}).items():
+            lines.append(f"\n{phase} counters:")
+            for name, count in sorted(counts.items()):
+                lines.append(f"  {name:24} {count:8,}")
+        
+        lines.append("")
+    
     # Footer
     lines.append("=" * 70)
     lines.append("END OF REPORT")
@@ -188,13 +289,394 @@ def format_report(report_data):
     return "\n".join(lines)
 
 
+STREAM_SECTIONS = {
+    "structural": "STRUCTURAL ISSUES",
+    "encoding": "ENCODING ISSUES",
+    "punctuation": "PUNCTUATION ISSUES",
+    "duplicate_verse": "DUPLICATE VERSES",
+    "out_of_order_verse": "OUT-OF-ORDER VERSES",
+    "comparison": "COMPARISON DIFFERENCES",
+}
+
+
+def format_issue_record(record):
+    """Format one issue record from an --issues-log stream"""
+    record_type = record.get("type")
+    ref = record.get("reference", "?")
+    
+    if record_type == "structural":
+        return f"  - {record.get('issue', '?')}"
+    if record_type in ("encoding", "punctuation"):
+        return f"  {ref}: {', '.join(record.get('issues', []))}"
+    if record_type == "duplicate_verse":
+        return f"  {ref}: {record.get('copies', 0)} copies"
+    if record_type == "out_of_order_verse":
+        return f"  {ref} follows verse {record.get('follows', '?')}"
+    if record_type == "comparison":
+        if "issue" in record:
+            return f"  {record['issue']}"
+        ref = f"{record.get('book')} {record.get('chapter')}:{record.get('verse')}"
+        line = f"  {ref}: {', '.join(record.get('differences', []))}"
+        if "text1" in record:
+            line += f"\n      Text 1: {record['text1']}"
+        if "text2" in record:
+            line += f"\n      Text 2: {record['text2']}"
+        return line
+    return f"  {json.dumps(record, ensure_ascii=False)}"
+
+
+def format_issue_stream(lines):
+    """
+    Format an NDJSON issue stream (aggregate_and_verify.py --issues-log).
+    
+    Yields output lines as records are read, so the stream is never held in
+    memory. A heading is emitted whenever the issue type or book changes;
+    every record is printed, nothing is truncated.
+    """
+    yield "=" * 70
+    yield "BIBLE DATA VERIFICATION ISSUES"
+    yield "=" * 70
+    
+    section = None
+    book = None
+    summary = None
+    
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {line_number}: {e}") from e
+        
+        record_type = record.get("type")
+        if record_type == "summary":
+            summary = record
+            continue
+        
+        if record_type != section:
+            section, book = record_type, None
+            yield ""
+            yield STREAM_SECTIONS.get(record_type, str(record_type).upper())
+            yield "-" * 70
+        if record.get("book") != book:
+            book = record.get("book")
+            yield f"\n{book}:"
+        
+        yield format_issue_record(record)
+    
+    yield ""
+    yield "SUMMARY"
+    yield "-" * 70
+    if summary is None:
+        yield "⚠ No summary record: the stream is incomplete"
+    else:
+        for record_type, count in summary.get("records", {}).items():
+            yield f"{STREAM_SECTIONS.get(record_type, record_type).title() + ':':26} {count}"
+        totals = summary.get("summary", {})
+        yield f"{'Books Verified:':26} {totals.get('books_verified', 0)}"
+    
+    yield ""
+    yield "=" * 70
+    yield "END OF REPORT"
+    yield "=" * 70
+
+
+INDEX_VERSION = 2
+CHECKPOINT_INTERVAL = 256  # Records between stored byte offsets within a group
+
+
+def record_difference(record):
+    """
+    How different the texts of a comparison record are, from 0 to 1.
+    
+    Records without an exact similarity (older logs kept only an upper
+    bound on it) count as 1, so --min-difference never drops a record
+    whose real difference could reach the threshold.
+    """
+    if "issue" in record:
+        return 1.0  # Chapter or verse missing from one side
+    if "similarity" in record:
+        return 1.0 - record["similarity"]
+    if "similarity_upper_bound" in record or "text1" in record:
+        return 1.0  # Significant difference of unknown size
+    return 0.0  # Only Strong's numbers or formatting differ
+
+
+def build_report_index(report_path):
+    """
+    Build the byte-offset index of an NDJSON issue stream.
+    
+    Records are written grouped by issue type and book, so the index stores
+    one entry per contiguous (type, book) run: its byte range, record count
+    and the offset of every CHECKPOINT_INTERVAL-th record. Comparison groups
+    also store their largest difference so threshold queries can skip them.
+    The summary record is kept in the index itself.
+    """
+    groups = []
+    summary = None
+    group = None
+    offset = 0
+    
+    with open(report_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                record_type = record.get("type")
+                if record_type == "summary":
+                    summary = record
+                else:
+                    book = record.get("book")
+                    if group is None or group["type"] != record_type or group["book"] != book:
+                        group = {"type": record_type, "book": book, "start": offset, "count": 0, "checkpoints": []}
+                        groups.append(group)
+                    if group["count"] % CHECKPOINT_INTERVAL == 0:
+                        group["checkpoints"].append(offset)
+                    group["count"] += 1
+                    group["end"] = offset + len(line)
+                    if record_type == "comparison":
+                        group["max_difference"] = max(group.get("max_difference", 0.0), record_difference(record))
+            offset += len(line)
+    
+    stat = os.stat(report_path)
+    return {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "groups": groups,
+        "summary": summary,
+    }
+
+
+def load_report_index(report_path, rebuild=False):
+    """
+    Load the sidecar index (<report>.idx), rebuilding it when missing or stale.
+    
+    The index is stale when the stream's size or modification time differs
+    from the recorded ones.
+    """
+    index_path = Path(str(report_path) + ".idx")
+    stat = os.stat(report_path)
+    
+    if not rebuild and index_path.exists():
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if (index.get("version") == INDEX_VERSION and index.get("size") == stat.st_size
+                    and index.get("mtime_ns") == stat.st_mtime_ns):
+                return index
+        except (OSError, json.JSONDecodeError):
+            pass
+    
+    index = build_report_index(report_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass  # A read-only location only costs a rebuild next time
+    return index
+
+
+class IndexedReport:
+    """
+    Random-access queries on an NDJSON issue stream through its sidecar index.
+    
+    Only the byte ranges of matching groups are read. Records skipped by
+    pagination are not parsed: whole groups are skipped by their count, and
+    within a group reading starts at the nearest checkpoint.
+    """
+    
+    def __init__(self, report_path, rebuild=False):
+        self.path = Path(report_path)
+        self.index = load_report_index(self.path, rebuild=rebuild)
+    
+    @property
+    def summary(self):
+        return self.index.get("summary")
+    
+    def groups(self, types=None, books=None, min_difference=None):
+        """Index groups matching the filters, in stream order"""
+        for group in self.index["groups"]:
+            if types and group["type"] not in types:
+                continue
+            if books and group["book"] not in books:
+                continue
+            if min_difference is not None:
+                if group["type"] != "comparison" or group.get("max_difference", 0.0) < min_difference:
+                    continue
+            yield group
+    
+    def count(self, types=None, books=None):
+        """Number of records matching type and book filters, from the index alone"""
+        return sum(group["count"] for group in self.groups(types, books))
+    
+    def _read_group(self, f, group, skip=0):
+        checkpoint = min(skip // CHECKPOINT_INTERVAL, len(group["checkpoints"]) - 1)
+        f.seek(group["checkpoints"][checkpoint])
+        skip -= checkpoint * CHECKPOINT_INTERVAL
+        
+        while f.tell() < group["end"]:
+            line = f.readline()
+            if not line.strip():
+                continue
+            if skip:
+                skip -= 1
+                continue
+            yield json.loads(line)
+    
+    def query(self, types=None, books=None, min_difference=None, offset=0, limit=None):
+        """
+        Yield matching records, skipping the first `offset` and stopping after `limit`.
+        
+        With min_difference only comparison records are considered, and
+        since the filter needs each record, skipped records are parsed.
+        """
+        if limit is not None and limit <= 0:
+            return
+        
+        with open(self.path, 'rb') as f:
+            for group in self.groups(types, books, min_difference):
+                skip = 0
+                if min_difference is None:
+                    if offset >= group["count"]:
+                        offset -= group["count"]
+                        continue
+                    skip, offset = offset, 0
+                
+                for record in self._read_group(f, group, skip):
+                    if min_difference is not None:
+                        if record_difference(record) < min_difference:
+                            continue
+                        if offset:
+                            offset -= 1
+                            continue
+                    yield record
+                    if limit is not None:
+                        limit -= 1
+                        if limit == 0:
+                            return
+
+
+def format_query_page(report, types=None, books=None, min_difference=None, page=1, page_size=50):
+    """Format one page of an indexed query; yields output lines"""
+    start = (page - 1) * page_size
+    records = list(report.query(types, books, min_difference, offset=start, limit=page_size + 1))
+    has_more = len(records) > page_size
+    records = records[:page_size]
+    
+    filters = []
+    if types:
+        filters.append("type " + ", ".join(types))
+    if books:
+        filters.append("book " + ", ".join(books))
+    if min_difference is not None:
+        filters.append(f"difference ≥ {min_difference:.0%}")
+    
+    yield f"Query: {'; '.join(filters) if filters else 'all issues'}"
+    if min_difference is None:
+        total = report.count(types, books)
+        pages = max(1, -(-total // page_size))
+        yield f"Page {page} of {pages} ({total} matching records)"
+    else:
+        yield f"Page {page}{'' if has_more else ' (last)'}"
+    yield "-" * 70
+    
+    section = book = None
+    for record in records:
+        if (record.get("type"), record.get("book")) != (section, book):
+            section, book = record.get("type"), record.get("book")
+            yield f"\n{STREAM_SECTIONS.get(section, str(section).upper())} - {book}:"
+        yield format_issue_record(record)
+    
+    if not records:
+        yield "No matching records"
+    elif has_more:
+        yield f"\nMore records: use --page {page + 1}"
+
+
+def is_issue_stream(report_path):
+    """
+    Whether a report file is an --issues-log NDJSON stream.
+    
+    Streams are recognized by content, whatever their name: the first line
+    is a complete JSON object with a "type" key, while a JSON report either
+    spans several lines or has no top-level "type".
+    """
+    if str(report_path).endswith(".ndjson"):
+        return True
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            first = f.readline()
+        record = json.loads(first)
+    except (OSError, UnicodeDecodeError, ValueError):
+        return False
+    return isinstance(record, dict) and "type" in record
+
+
 def main():
     parser = argparse.ArgumentParser(description="Format verification report JSON")
-    parser.add_argument("report", help="Path to JSON report file")
+    parser.add_argument("report", help="Path to JSON report file, or NDJSON issue stream")
     parser.add_argument("--output", help="Output text file (default: print to console)")
+    parser.add_argument("--type", action="append", choices=sorted(STREAM_SECTIONS),
+                        help="Only show this issue type (NDJSON streams; can be repeated)")
+    parser.add_argument("--book", action="append", help="Only show issues in this book (NDJSON streams; can be repeated)")
+    parser.add_argument("--min-difference", type=float,
+                        help="Only show comparison differences of at least this fraction, e.g. 0.5")
+    parser.add_argument("--page", type=int, help="Page of matching records to show (NDJSON streams)")
+    parser.add_argument("--page-size", type=int, default=50, help="Records per page (default: 50)")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the stream's .idx sidecar index")
     
     args = parser.parse_args()
     
+    # Filtered or paginated queries go through the sidecar index
+    querying = args.type or args.book or args.min_difference is not None or args.page or args.reindex
+    stream = is_issue_stream(args.report)
+    if stream and querying:
+        if (args.page or 1) < 1 or args.page_size < 1:
+            print("Error: --page and --page-size must be positive", file=sys.stderr)
+            sys.exit(1)
+        try:
+            report = IndexedReport(args.report, rebuild=args.reindex)
+            lines = list(format_query_page(report, args.type, args.book, args.min_difference,
+                                           args.page or 1, args.page_size))
+        except FileNotFoundError:
+            print(f"Error: Report file '{args.report}' not found", file=sys.stderr)
+            sys.exit(1)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid NDJSON in report file: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        formatted = "\n".join(lines)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(formatted)
+            print(f"Report saved to: {args.output}")
+        else:
+            print(formatted)
+        return
+    
+    # Issue streams are formatted record by record
+    if stream:
+        try:
+            with open(args.report, 'r', encoding='utf-8') as f:
+                if args.output:
+                    with open(args.output, 'w', encoding='utf-8') as out:
+                        for line in format_issue_stream(f):
+                            out.write(line + "\n")
+                    print(f"Report saved to: {args.output}")
+                else:
+                    for line in format_issue_stream(f):
+                        print(line)
+        except FileNotFoundError:
+            print(f"Error: Report file '{args.report}' not found", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: Invalid NDJSON in report file: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Load JSON report
     try:
         with open(args.report, 'r', encoding='utf-8') as f:
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Normalize Strong's references across every book file.
+
+Bulk version of fix_2chronicles_strongs.py: removes suffix letters and
+leading zeros ([H0430G] -> [H430], [G0976] -> [G976]) in every book in
+public/data, in a single pass per file.
+
+The substitution runs directly on the raw file bytes. A tag can only appear
+inside a JSON string (a bare '[' followed by H/G and digits is not valid
+JSON), so this is safe, keeps the file's formatting untouched, and avoids
+parsing and re-serializing books that need no changes. The pattern only
+matches tags that need a fix, so fixes are counted in the same pass and a
+clean corpus is a single regex scan per file. Changed files are written via
+temp file and rename.
+
+Usage:
+    python3 scripts/normalize_strongs.py
+    python3 scripts/normalize_strongs.py --data public/data --book 2Chronicles --dry-run
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS
+
+# Tags with a leading zero (two or more digits) or a suffix letter
+FIXABLE_TAG = re.compile(rb'\[([HG])(?=0\d|\d+[A-Z])(\d+)([A-Z]*)\]')
+
+
+def normalize_bytes(data: bytes) -> Tuple[bytes, Dict[str, int]]:
+    """Return (normalized data, {"suffix": n, "leading_zero": n})"""
+    counts = {"suffix": 0, "leading_zero": 0}
+
+    def fix(match):
+        prefix, digits, suffix = match.groups()
+        if suffix:
+            counts["suffix"] += 1
+        number = digits.lstrip(b'0') or b'0'
+        if number != digits:
+            counts["leading_zero"] += 1
+        return b'[' + prefix + number + b']'
+
+    return FIXABLE_TAG.sub(fix, data), counts
+
+
+def normalize_book(book_file: Path, dry_run=False) -> Dict[str, int]:
+    """Normalize one book file; it is rewritten only if something changed"""
+    with open(book_file, 'rb') as f:
+        data = f.read()
+
+    normalized, counts = normalize_bytes(data)
+    counts["written"] = False
+
+    if normalized != data and not dry_run:
+        tmp_file = book_file.with_name(book_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(normalized)
+        os.replace(tmp_file, book_file)
+        counts["written"] = True
+
+    counts["bytes"] = len(data)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove suffix letters and leading zeros from Strong's references")
+    parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    parser.add_argument("--book", action="append", help="Only normalize this book (can be repeated)")
+    parser.add_argument("--dry-run", action="store_true", help="Count fixes without writing any file")
+    parser.add_argument("--verbose", action="store_true", help="Show every book, including unchanged ones")
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data)
+    books = args.book or list(KJV_CHAPTER_COUNTS)
+
+    start = time.perf_counter()
+    totals = {"suffix": 0, "leading_zero": 0, "bytes": 0}
+    files_changed = 0
+    books_scanned = 0
+
+    for book_name in books:
+        book_file = data_dir / f"{book_name}.json"
+        if not book_file.exists():
+            if args.book:
+                print(f"Error: {book_file} not found")
+                sys.exit(1)
+            continue
+
+        try:
+            counts = normalize_book(book_file, dry_run=args.dry_run)
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        books_scanned += 1
+        for key in totals:
+            totals[key] += counts[key]
+
+        changed = counts["suffix"] or counts["leading_zero"]
+        if changed:
+            files_changed += 1
+        if changed or args.verbose:
+            print(f"  {book_name}: {counts['suffix']} suffix letters, {counts['leading_zero']} leading zeros")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nBooks scanned: {books_scanned} ({totals['bytes'] / 1e6:.1f} MB in {elapsed:.2f}s)")
+    print(f"Fixed {totals['suffix']} references with suffix letters")
+    print(f"Fixed {totals['leading_zero']} references with leading zeros")
+    if args.dry_run:
+        print(f"Files that would change: {files_changed} (dry run, nothing written)")
+    else:
+        print(f"Files rewritten: {files_changed}")
+
+
+if __name__ == '__main__':
+    main()
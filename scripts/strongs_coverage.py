@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Strong's Coverage and Density Report
+
+Measures how thoroughly the corpus is tagged with Strong's numbers, which
+is how auto-tagging runs such as add_strongs.py are judged. One pass over
+every book builds a sparse book x Strong's-number count matrix and
+per-book and per-chapter word counts, and reports:
+
+    coverage         share of words carrying at least one tag
+    untagged ratio   share of words carrying none
+    density          tags per word, and distinct numbers per book
+    outlier chapters chapters whose coverage is far from their book's norm
+
+A word is a whitespace-separated token with at least one letter or digit
+once tags and <em> markup are removed; it is tagged if the token holds a
+tag. Standalone tags (e.g. an untranslated [H853]) count towards the matrix
+but are not words. Books are read through iter_compacted_chapters.
+
+The matrix is kept in CSR layout (row pointers, column indices, counts) in
+stdlib arrays: the corpus has 66 rows and about 14,000 columns, of which
+only a few percent are non-zero, so no dense table is ever built.
+
+Usage:
+    python3 scripts/strongs_coverage.py
+    python3 scripts/strongs_coverage.py --data public/data --output strongs_coverage.json --matrix strongs_matrix.json
+    python3 scripts/strongs_coverage.py --book 2Chronicles --book 1Chronicles
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from aggregate_and_verify import KJV_CHAPTER_COUNTS, iter_compacted_chapters
+from book_stream import BookStreamError
+from build_strongs_index import STRONGS_TAG
+
+EM_TAG = re.compile(r'</?em>')
+WORD_CHAR = re.compile(r'\w')
+
+# Chapters whose coverage is this many standard deviations from their book's mean
+DEFAULT_Z_THRESHOLD = 2.0
+
+
+class SparseCountMatrix:
+    """
+    Integer count matrix in compressed sparse row (CSR) layout.
+
+    Rows are appended whole; columns are created on first use from a label
+    such as "H430". Row i's entries are indices[indptr[i]:indptr[i + 1]]
+    with counts at the same positions in data, sorted by column index.
+    """
+
+    def __init__(self):
+        self.column_index = {}
+        self.column_labels = []
+        self.indptr = array('I', [0])
+        self.indices = array('I')
+        self.data = array('I')
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.indptr) - 1, len(self.column_labels)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def column(self, label: str) -> int:
+        index = self.column_index.get(label)
+        if index is None:
+            index = self.column_index[label] = len(self.column_labels)
+            self.column_labels.append(label)
+        return index
+
+    def append_row(self, counts: Dict[int, int]):
+        for column in sorted(counts):
+            self.indices.append(column)
+            self.data.append(counts[column])
+        self.indptr.append(len(self.data))
+
+    def row(self, i: int) -> Iterator[Tuple[int, int]]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+
+    def row_sum(self, i: int) -> int:
+        return sum(self.data[self.indptr[i]:self.indptr[i + 1]])
+
+    def row_nnz(self, i: int) -> int:
+        return self.indptr[i + 1] - self.indptr[i]
+
+    def column_sums(self) -> array:
+        sums = array('I', bytes(4 * len(self.column_labels)))
+        for column, count in zip(self.indices, self.data):
+            sums[column] += count
+        return sums
+
+    def column_nnz(self) -> array:
+        """Number of rows in which each column occurs"""
+        counts = array('I', bytes(4 * len(self.column_labels)))
+        for column in self.indices:
+            counts[column] += 1
+        return counts
+
+    def to_json(self, row_labels: List[str]) -> Dict:
+        return {
+            "format": "csr",
+            "shape": list(self.shape),
+            "rows": row_labels,
+            "columns": self.column_labels,
+            "indptr": self.indptr.tolist(),
+            "indices": self.indices.tolist(),
+            "data": self.data.tolist(),
+        }
+
+
+def scan_verse(text: str) -> Tuple[int, int, List[str]]:
+    """(words, tagged words, Strong's numbers) of one verse"""
+    words = 0
+    tagged = 0
+    numbers = []
+
+    for token in EM_TAG.sub('', text).split():
+        if '[' not in token:
+            words += 1
+            continue
+        tags = STRONGS_TAG.findall(token)
+        numbers.extend(f"{prefix}{int(digits)}" for prefix, digits in tags)
+        if WORD_CHAR.search(STRONGS_TAG.sub('', token)):
+            words += 1
+            if tags:
+                tagged += 1
+
+    return words, tagged, numbers
+
+
+def _ratio(part: int, whole: int) -> float:
+    return round(part / whole, 4) if whole else 0.0
+
+
+def analyze_corpus(data_dir: Path, books: List[str] = None, z_threshold: float = DEFAULT_Z_THRESHOLD,
+                   verbose=False) -> Tuple[SparseCountMatrix, Dict]:
+    """Scan every book once; returns (book x number matrix, report)"""
+    if books is None:
+        books = [name for name in KJV_CHAPTER_COUNTS if (data_dir / f"{name}.json").exists()]
+
+    matrix = SparseCountMatrix()
+    report_books = {}
+    outliers = []
+
+    for book_name in books:
+        if verbose:
+            print(f"  Scanning {book_name}...")
+        counts = Counter()
+        chapters = []
+        totals = Counter()
+
+        for chapter_num, verses in iter_compacted_chapters(data_dir / f"{book_name}.json", book_name):
+            chapter_words = chapter_tagged = 0
+            for verse in verses:
+                words, tagged, numbers = scan_verse(verse.get("text", ""))
+                chapter_words += words
+                chapter_tagged += tagged
+                totals["verses"] += 1
+                if numbers:
+                    totals["verses_with_strongs"] += 1
+                    totals["tags"] += len(numbers)
+                    for number in numbers:
+                        counts[matrix.column(number)] += 1
+            chapters.append((chapter_num, chapter_words, chapter_tagged))
+            totals["words"] += chapter_words
+            totals["tagged_words"] += chapter_tagged
+
+        row = len(matrix.indptr) - 1
+        matrix.append_row(counts)
+
+        coverage = _ratio(totals["tagged_words"], totals["words"])
+        report_books[book_name] = {
+            "chapters": len(chapters),
+            "verses": totals["verses"],
+            "verses_with_strongs": totals["verses_with_strongs"],
+            "words": totals["words"],
+            "tagged_words": totals["tagged_words"],
+            "coverage": coverage,
+            "untagged_ratio": round(1 - coverage, 4) if totals["words"] else 0.0,
+            "tags": totals["tags"],
+            "tags_per_word": _ratio(totals["tags"], totals["words"]),
+            "distinct_numbers": matrix.row_nnz(row),
+        }
+
+        # Chapters far from the book's own coverage, e.g. ones a tagging run missed
+        ratios = [tagged / words for _, words, tagged in chapters if words]
+        if len(ratios) < 3:
+            continue
+        mean = statistics.fmean(ratios)
+        stdev = statistics.pstdev(ratios, mean)
+        if stdev == 0:
+            continue
+        for chapter_num, words, tagged in chapters:
+            if not words:
+                continue
+            z = (tagged / words - mean) / stdev
+            if abs(z) >= z_threshold:
+                outliers.append({
+                    "book": book_name,
+                    "chapter": chapter_num,
+                    "words": words,
+                    "coverage": _ratio(tagged, words),
+                    "book_mean": round(mean, 4),
+                    "z_score": round(z, 2),
+                })
+
+    totals = Counter()
+    for stats in report_books.values():
+        totals.update({key: stats[key] for key in ("verses", "verses_with_strongs", "words", "tagged_words", "tags")})
+    column_sums = matrix.column_sums()
+    column_books = matrix.column_nnz()
+    top = sorted(range(len(column_sums)), key=lambda column: -column_sums[column])[:20]
+
+    report = {
+        "corpus": {
+            "books": len(books),
+            "verses": totals["verses"],
+            "verses_with_strongs": totals["verses_with_strongs"],
+            "words": totals["words"],
+            "tagged_words": totals["tagged_words"],
+            "coverage": _ratio(totals["tagged_words"], totals["words"]),
+            "tags": totals["tags"],
+            "distinct_numbers": matrix.shape[1],
+            "matrix_nonzero": matrix.nnz,
+            "matrix_density": _ratio(matrix.nnz, matrix.shape[0] * matrix.shape[1]),
+        },
+        "books": report_books,
+        "outlier_chapters": outliers,
+        "top_numbers": [
+            {"number": matrix.column_labels[column], "count": column_sums[column], "books": column_books[column]}
+            for column in top
+        ],
+    }
+    return matrix, report
+
+
+def _write_json(path: Path, data, indent=None):
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, separators=None if indent else (',', ':'))
+    os.replace(tmp_file, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report Strong's tagging coverage and density for the corpus")
+    parser.add_argument("--data", default="public/data", help="Directory containing book-level JSON files")
+    parser.add_argument("--book", action="append", help="Only analyze this book (can be repeated)")
+    parser.add_argument("--output", default="strongs_coverage.json", help="JSON report file")
+    parser.add_argument("--matrix", help="Also write the book x Strong's number count matrix (CSR) to this file")
+    parser.add_argument("--z-threshold", type=float, default=DEFAULT_Z_THRESHOLD,
+                        help=f"Outlier chapters deviate from their book's mean coverage by this many standard deviations (default: {DEFAULT_Z_THRESHOLD})")
+    parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data)
+    start = time.perf_counter()
+    try:
+        matrix, report = analyze_corpus(data_dir, args.book, args.z_threshold, verbose=args.verbose)
+    except (OSError, BookStreamError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Book':20} {'Words':>8} {'Coverage':>9} {'Tags/word':>10} {'Numbers':>8}")
+    for book_name, stats in report["books"].items():
+        print(f"{book_name:20} {stats['words']:8,} {stats['coverage']:9.1%} "
+              f"{stats['tags_per_word']:10.2f} {stats['distinct_numbers']:8,}")
+
+    if report["outlier_chapters"]:
+        print(f"\nOutlier chapters (|z| >= {args.z_threshold:g}):")
+        for outlier in report["outlier_chapters"]:
+            print(f"  {outlier['book']} {outlier['chapter']}: {outlier['coverage']:.1%} coverage "
+                  f"vs {outlier['book_mean']:.1%} for the book (z = {outlier['z_score']:+.2f})")
+
+    corpus = report["corpus"]
+    print(f"\nCorpus: {corpus['words']:,} words, {corpus['coverage']:.1%} tagged, "
+          f"{corpus['distinct_numbers']:,} distinct numbers")
+    print(f"Matrix: {matrix.shape[0]} x {matrix.shape[1]}, {corpus['matrix_nonzero']:,} non-zero "
+          f"({corpus['matrix_density']:.2%} dense), built in {elapsed:.2f}s")
+
+    _write_json(Path(args.output), report, indent=2)
+    print(f"Report saved to: {args.output}")
+    if args.matrix:
+        _write_json(Path(args.matrix), matrix.to_json(list(report["books"])))
+        print(f"Matrix saved to: {args.matrix}")
+
+
+if __name__ == "__main__":
+    main()
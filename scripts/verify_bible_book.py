@@ -9,18 +9,35 @@ This script verifies a Bible book JSON file for:
 4. Punctuation consistency
 5. Whitespace and formatting issues
 
+Batch mode checks every book of a data directory against the same-named
+files of a reference directory in a worker pool, and writes one JSON result
+with per-book pass/fail and issue counts.
+
 Usage:
     python3 scripts/verify_bible_book.py <book_file> <reference_file>
+    python3 scripts/verify_bible_book.py --batch <data_dir> <reference_dir> [--jobs N] [--output FILE]
     
 Example:
     python3 scripts/verify_bible_book.py public/data/2Chronicles.json /tmp/Bible-kjv/2Chronicles.json
+    python3 scripts/verify_bible_book.py --batch public/data /tmp/Bible-kjv --jobs 4
 """
 
+import argparse
 import json
+import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from aggregate_and_verify import KJV_CHAPTER_COUNTS
+from book_stream import BookStreamError, iter_chapters
+from verse_rules import check_format
+
+# Issues kept per book in the batch result; all of them are counted
+BATCH_ISSUE_SAMPLES = 100
+
 
 def normalize_text(text):
     """Remove Strong's numbers and em tags for comparison"""
@@ -32,6 +49,84 @@ def normalize_text(text):
     return ' '.join(text.split())
 
 
+def check_bible_book(book_file, reference_file):
+    """
+    Run every check on a book file against its reference, without printing.
+    
+    Returns a dict with the book name, chapter, verse and Strong's counts and
+    the list of issues; "error" is set instead if either file cannot be read
+    or holds a malformed verse record.
+    """
+    issues = []
+    total_verses = 0
+    total_chapters = 0
+    verses_with_strongs = 0
+    book_meta = {}
+    
+    # Both files are streamed one chapter at a time rather than loaded whole
+    ref_chapters = iter_chapters(reference_file)
+    ref_exhausted = False
+    location = None
+    
+    try:
+        # Verify each verse
+        for ch_num, verses in iter_chapters(book_file, meta=book_meta):
+            total_chapters += 1
+            
+            ref_chapter = None if ref_exhausted else next(ref_chapters, None)
+            if ref_chapter is None:
+                ref_exhausted = True
+                issues.append(f"Chapter {ch_num}: Missing in reference")
+                continue
+            
+            ref_verses = ref_chapter[1]
+            
+            for v_idx, verse in enumerate(verses):
+                location = f"chapter {ch_num}, verse #{v_idx + 1}"
+                verse_num = verse['verse']
+                text = verse['text']
+                total_verses += 1
+                ref = f"{ch_num}:{verse_num}"
+                
+                # Count verses with Strong's numbers
+                if '[H' in text or '[G' in text:
+                    verses_with_strongs += 1
+                
+                if v_idx >= len(ref_verses):
+                    issues.append(f"{ref}: Missing in reference")
+                    continue
+                
+                ref_verse = ref_verses[v_idx]
+                ref_text = ref_verse['text']
+                
+                # Checks 1, 3, 4 and 5: arrows, Strong's formatting, brackets, whitespace
+                arrow_issues, markup_issues = check_format(text)
+                issues.extend(f"{ref}: {issue}" for issue in arrow_issues)
+                
+                # Check 2: Text accuracy
+                curr_norm = normalize_text(text)
+                ref_norm = normalize_text(ref_text)
+                if curr_norm != ref_norm:
+                    issues.append(f"{ref}: TEXT MISMATCH")
+                
+                issues.extend(f"{ref}: {issue}" for issue in markup_issues)
+    except BookStreamError as e:
+        label = "reference" if e.filepath == str(reference_file) else "book"
+        return {"error": f"Cannot load {label} file: {e}"}
+    except (KeyError, TypeError, AttributeError) as e:
+        # A verse without "verse" or "text", or one that is not an object
+        detail = f"missing {e}" if isinstance(e, KeyError) else str(e)
+        return {"error": f"Malformed verse record at {location or 'start of book'}: {detail}"}
+    
+    return {
+        "book": book_meta.get('book', 'Unknown'),
+        "chapters": total_chapters,
+        "verses": total_verses,
+        "verses_with_strongs": verses_with_strongs,
+        "issues": issues,
+    }
+
+
 def verify_bible_book(book_file, reference_file):
     """Comprehensive verification of a Bible book file"""
     
@@ -42,100 +137,21 @@ def verify_bible_book(book_file, reference_file):
     print(f"Reference: {reference_file}")
     print()
     
-    # Load files
-    try:
-        with open(book_file, 'r', encoding='utf-8') as f:
-            book_data = json.load(f)
-    except Exception as e:
-        print(f"❌ ERROR: Cannot load book file: {e}")
-        return False
-    
-    try:
-        with open(reference_file, 'r', encoding='utf-8') as f:
-            ref_data = json.load(f)
-    except Exception as e:
-        print(f"❌ ERROR: Cannot load reference file: {e}")
+    result = check_bible_book(book_file, reference_file)
+    if "error" in result:
+        print(f"❌ ERROR: {result['error']}")
         return False
     
-    issues = []
-    total_verses = 0
-    verses_with_strongs = 0
-    
-    # Arrow symbols to check
-    arrow_chars = ['→', '←', '↑', '↓', '⇒', '⇐', '➜', '➔', '⟶', '⟵', '⟷', '⇄', '⇌', '↔']
-    ascii_arrows = ['-->', '<--', '=>', '<=', '->', '<-']
-    
-    # Verify each verse
-    for ch_idx, chapter in enumerate(book_data['chapters']):
-        ch_num = chapter['chapter']
-        
-        if ch_idx >= len(ref_data['chapters']):
-            issues.append(f"Chapter {ch_num}: Missing in reference")
-            continue
-        
-        ref_chapter = ref_data['chapters'][ch_idx]
-        
-        for v_idx, verse in enumerate(chapter['verses']):
-            verse_num = verse['verse']
-            text = verse['text']
-            total_verses += 1
-            ref = f"{ch_num}:{verse_num}"
-            
-            # Count verses with Strong's numbers
-            if '[H' in text or '[G' in text:
-                verses_with_strongs += 1
-            
-            if v_idx >= len(ref_chapter['verses']):
-                issues.append(f"{ref}: Missing in reference")
-                continue
-            
-            ref_verse = ref_chapter['verses'][v_idx]
-            ref_text = ref_verse['text']
-            
-            # Check 1: Arrow symbols
-            for arrow in arrow_chars:
-                if arrow in text:
-                    issues.append(f"{ref}: ARROW FOUND: {arrow}")
-            
-            for arrow in ascii_arrows:
-                if arrow in text:
-                    issues.append(f"{ref}: ASCII ARROW: {arrow}")
-            
-            # Check 2: Text accuracy
-            curr_norm = normalize_text(text)
-            ref_norm = normalize_text(ref_text)
-            if curr_norm != ref_norm:
-                issues.append(f"{ref}: TEXT MISMATCH")
-            
-            # Check 3: Strong's number formatting
-            valid_strongs = re.findall(r'\[(?:H|G)\d+[A-Z]?\]', text)
-            all_brackets = re.findall(r'\[[^\]]*\]', text)
-            
-            for bracket in all_brackets:
-                if bracket not in valid_strongs:
-                    if '[H' in bracket or '[G' in bracket or '[h' in bracket or '[g' in bracket:
-                        issues.append(f"{ref}: MALFORMED STRONG'S: {bracket}")
-            
-            # Check 4: Bracket matching
-            open_count = text.count('[')
-            close_count = text.count(']')
-            if open_count != close_count:
-                issues.append(f"{ref}: MISMATCHED BRACKETS: {open_count} [ vs {close_count} ]")
-            
-            # Check 5: Whitespace issues
-            if '  ' in text:
-                issues.append(f"{ref}: DOUBLE SPACE")
-            if '\t' in text:
-                issues.append(f"{ref}: TAB CHARACTER")
-            if text != text.strip():
-                issues.append(f"{ref}: LEADING/TRAILING WHITESPACE")
+    issues = result["issues"]
+    total_verses = result["verses"]
+    verses_with_strongs = result["verses_with_strongs"]
     
     # Print results
     print("=" * 80)
     print("VERIFICATION RESULTS")
     print("=" * 80)
-    print(f"\nBook: {book_data.get('book', 'Unknown')}")
-    print(f"Total chapters: {len(book_data['chapters'])}")
+    print(f"\nBook: {result['book']}")
+    print(f"Total chapters: {result['chapters']}")
     print(f"Total verses: {total_verses}")
     print(f"Verses with Strong's numbers: {verses_with_strongs} ({verses_with_strongs*100//total_verses}%)")
     print(f"\nIssues found: {len(issues)}")
@@ -163,15 +179,129 @@ def verify_bible_book(book_file, reference_file):
         return True
 
 
+def _batch_task(task):
+    """Process pool entry point: check one book and summarize the result"""
+    book_name, book_file, reference_file = task
+    
+    if not Path(book_file).exists():
+        return {"status": "missing", "error": "Book file not found"}
+    if not Path(reference_file).exists():
+        return {"status": "error", "error": "Reference file not found"}
+    
+    result = check_bible_book(book_file, reference_file)
+    if "error" in result:
+        return {"status": "error", "error": result["error"]}
+    
+    issues = result.pop("issues")
+    # "1:5: TEXT MISMATCH" and "1:6: ARROW FOUND: →" count as "TEXT MISMATCH" and "ARROW FOUND"
+    issue_types = Counter(issue.split(": ")[1] for issue in issues)
+    result.update({
+        "status": "fail" if issues else "pass",
+        "issue_count": len(issues),
+        "issue_types": dict(issue_types.most_common()),
+        "issues": issues[:BATCH_ISSUE_SAMPLES],
+    })
+    return result
+
+
+def verify_directory(data_dir, reference_dir, books=None, jobs=1):
+    """
+    Verify every book in data_dir against reference_dir/<Book>.json.
+    
+    Books default to the KJV books present in data_dir. Results are keyed by
+    book in canonical order whichever worker finishes first. A book passes
+    when it has no issues; missing books, missing references and unreadable
+    files fail the run.
+    """
+    data_dir = Path(data_dir)
+    reference_dir = Path(reference_dir)
+    if books is None:
+        books = [book for book in KJV_CHAPTER_COUNTS if (data_dir / f"{book}.json").exists()]
+    
+    tasks = [(book, str(data_dir / f"{book}.json"), str(reference_dir / f"{book}.json")) for book in books]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_batch_task, tasks))
+    else:
+        results = [_batch_task(task) for task in tasks]
+    
+    statuses = Counter(result["status"] for result in results)
+    return {
+        "data_dir": str(data_dir),
+        "reference_dir": str(reference_dir),
+        "books": dict(zip(books, results)),
+        "summary": {
+            "books": len(books),
+            "passed": statuses["pass"],
+            "failed": statuses["fail"],
+            "errors": statuses["error"] + statuses["missing"],
+            "issues": sum(result.get("issue_count", 0) for result in results),
+            "success": len(books) > 0 and statuses["pass"] == len(books),
+        },
+    }
+
+
+def run_batch(args):
+    """Batch mode: verify a data directory, write the JSON result, exit on failure"""
+    for directory in (args.book_file, args.reference_file):
+        if not Path(directory).is_dir():
+            print(f"❌ ERROR: Not a directory: {directory}")
+            sys.exit(1)
+    
+    result = verify_directory(args.book_file, args.reference_file, args.book, args.jobs)
+    
+    for book, book_result in result["books"].items():
+        status = book_result["status"]
+        if status == "pass":
+            print(f"✅ {book:20} {book_result['verses']:6} verses")
+        elif status == "fail":
+            types = ", ".join(f"{label} ×{count}" for label, count in book_result["issue_types"].items())
+            print(f"❌ {book:20} {book_result['issue_count']:6} issues ({types})")
+        else:
+            print(f"❌ {book:20} {book_result['error']}")
+    
+    summary = result["summary"]
+    print(f"\nBooks: {summary['books']}, passed: {summary['passed']}, failed: {summary['failed']}, "
+          f"errors: {summary['errors']}, issues: {summary['issues']}")
+    
+    output = Path(args.output)
+    tmp_file = output.with_name(output.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, output)
+    print(f"Results saved to: {output}")
+    
+    sys.exit(0 if summary["success"] else 1)
+
+
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python3 verify_bible_book.py <book_file> <reference_file>")
-        print("\nExample:")
-        print("  python3 scripts/verify_bible_book.py public/data/2Chronicles.json /tmp/Bible-kjv/2Chronicles.json")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Verify Bible book files against a KJV reference",
+        epilog="Example: python3 scripts/verify_bible_book.py public/data/2Chronicles.json /tmp/Bible-kjv/2Chronicles.json"
+    )
+    parser.add_argument("book_file", help="Book JSON file (data directory with --batch)")
+    parser.add_argument("reference_file", help="Reference JSON file (reference directory with --batch)")
+    parser.add_argument("--batch", action="store_true", help="Verify every book in a data directory against a reference directory")
+    parser.add_argument("--book", action="append", help="With --batch, only verify this book (can be repeated)")
+    parser.add_argument("--jobs", type=int, help="With --batch, number of worker processes (default: 1)")
+    parser.add_argument("--output", help="With --batch, JSON result file (default: bible_verification.json)")
+    
+    args = parser.parse_args()
+    
+    if args.batch:
+        if args.jobs is None:
+            args.jobs = 1
+        if args.output is None:
+            args.output = "bible_verification.json"
+        run_batch(args)
+    
+    batch_only = [option for option, value in (("--book", args.book), ("--jobs", args.jobs), ("--output", args.output))
+                  if value is not None]
+    if batch_only:
+        parser.error(f"{', '.join(batch_only)} can only be used with --batch")
     
-    book_file = sys.argv[1]
-    reference_file = sys.argv[2]
+    book_file = args.book_file
+    reference_file = args.reference_file
     
     if not Path(book_file).exists():
         print(f"❌ ERROR: Book file not found: {book_file}")
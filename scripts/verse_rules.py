@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compiled verse checks shared by the verification scripts
+
+Each check family starts with one combined, character-class-led regex scan
+over the verse text. Clean verses, which are the overwhelming majority of the
+corpus, stop there. Only verses that trip a scan are examined rule by rule to
+build the exact issue labels, so the output matches the original checks.
+
+Used by:
+    aggregate_and_verify.py  (check_encoding, check_punctuation)
+    verify_bible_book.py     (check_format)
+"""
+
+import re
+from typing import List, Tuple
+
+# Bump whenever a rule or an issue label changes
+RULES_VERSION = 1
+
+# Arrow symbols reported by verify_bible_book.py, in report order
+ARROW_CHARS = ['→', '←', '↑', '↓', '⇒', '⇐', '➜', '➔', '⟶', '⟵', '⟷', '⇄', '⇌', '↔']
+ASCII_ARROWS = ['-->', '<--', '=>', '<=', '->', '<-']
+
+STRONGS_PATTERN = re.compile(r'\[(?:H|G)\d+[A-Z]?\]')
+BRACKET_PATTERN = re.compile(r'\[[^\]]*\]')
+STRONGS_PREFIX_PATTERN = re.compile(r'\[[HGhg]')
+
+# Control characters other than \n, \r and \t
+CONTROL_PATTERN = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Anything check_encoding reports: control characters, the replacement
+# character and lone surrogates (which cannot be encoded as UTF-8)
+ENCODING_SCAN = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f�\ud800-\udfff]')
+
+# Superset of the punctuation rules below: every rule hit contains one of
+# these character pairs. The scan jumps between candidate end characters and
+# only then looks behind, so a clean verse costs a single fast pass.
+PUNCTUATION_SCAN = re.compile(r'[.,;:?!A-Z](?<=[.?!,;:\s][.,;:?!]|[.?!][A-Z])')
+PUNCTUATION_RULES = [
+    (re.compile(r'\.{4,}|[?!,;:]{2,}'), "Unusual punctuation pattern"),
+    (re.compile(r'\s+[.,;:]'), "Space before punctuation"),
+    (re.compile(r'[.?!][A-Z]'), "Missing space after sentence-ending punctuation"),
+]
+
+# Every arrow check_format reports contains one of these characters
+ARROW_SCAN = re.compile('[' + ''.join(ARROW_CHARS) + r'\-=]')
+
+# An opening bracket that does not start a well-formed Strong's tag
+STRAY_BRACKET_SCAN = re.compile(r'\[(?!(?:H|G)\d+[A-Z]?\])')
+
+REPLACEMENT_CHAR_ISSUE = "Encoding issue: replacement character '�' found"
+
+
+def check_encoding(text: str) -> List[str]:
+    """Check for encoding issues in text"""
+    if not ENCODING_SCAN.search(text):
+        return []
+
+    issues = []
+
+    if '�' in text:
+        # The original check listed U+FFFD twice, so the label is
+        # reported twice to keep existing reports stable
+        issues.extend([REPLACEMENT_CHAR_ISSUE, REPLACEMENT_CHAR_ISSUE])
+
+    control_chars = CONTROL_PATTERN.findall(text)
+    if control_chars:
+        issues.append(f"Control characters found: {[ord(c) for c in control_chars]}")
+
+    try:
+        text.encode('utf-8')
+    except UnicodeEncodeError as e:
+        issues.append(f"UTF-8 encoding error: {e}")
+
+    return issues
+
+
+def check_punctuation(text: str) -> List[str]:
+    """Check for punctuation issues"""
+    if not PUNCTUATION_SCAN.search(text):
+        return []
+
+    return [label for pattern, label in PUNCTUATION_RULES if pattern.search(text)]
+
+
+def check_format(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Check arrows, Strong's markup, brackets and whitespace in a verse.
+
+    Returns (arrow_issues, markup_issues) so callers can keep their own
+    checks in between, as verify_bible_book.py does with the text comparison.
+    """
+    arrow_issues = []
+    markup_issues = []
+
+    if ARROW_SCAN.search(text):
+        for arrow in ARROW_CHARS:
+            if arrow in text:
+                arrow_issues.append(f"ARROW FOUND: {arrow}")
+
+        for arrow in ASCII_ARROWS:
+            if arrow in text:
+                arrow_issues.append(f"ASCII ARROW: {arrow}")
+
+    # Tags never overlap and each holds exactly one '[' and one ']', so when
+    # every '[' opens a tag and the counts agree there is nothing to report
+    open_count = text.count('[')
+    close_count = text.count(']')
+    if open_count != close_count or STRAY_BRACKET_SCAN.search(text):
+        for bracket in BRACKET_PATTERN.findall(text):
+            if not STRONGS_PATTERN.fullmatch(bracket) and STRONGS_PREFIX_PATTERN.search(bracket):
+                markup_issues.append(f"MALFORMED STRONG'S: {bracket}")
+
+        if open_count != close_count:
+            markup_issues.append(f"MISMATCHED BRACKETS: {open_count} [ vs {close_count} ]")
+
+    if '  ' in text:
+        markup_issues.append("DOUBLE SPACE")
+    if '\t' in text:
+        markup_issues.append("TAB CHARACTER")
+    if text[:1].isspace() or text[-1:].isspace():
+        markup_issues.append("LEADING/TRAILING WHITESPACE")
+
+    return arrow_issues, markup_issues